@@ -24,6 +24,9 @@ MAX_PAGE_SIZE = 1000
 RATE_LIMIT_STATS = "30/minute"  # Heavy statistical operations
 RATE_LIMIT_EXPORT = "10/minute"  # Export operations
 RATE_LIMIT_GENERAL = "100/minute"  # General API calls
+# Shared counter storage so limits hold across workers/replicas
+RATE_LIMIT_STORAGE_URI = os.environ.get("RATE_LIMIT_STORAGE_URI", os.environ.get("REDIS_URL", "memory://"))
+RATE_LIMIT_STRATEGY = "moving-window"
 
 # Background Jobs
 CELERY_BROKER_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
@@ -32,9 +35,11 @@ JOB_TIMEOUT = 300  # 5 minutes max for background jobs
 JOB_CLEANUP_AFTER = 3600  # Clean up job results after 1 hour
 
 # MongoDB Connection Pool
-MONGO_MIN_POOL_SIZE = 5
-MONGO_MAX_POOL_SIZE = 50
+MONGO_MIN_POOL_SIZE = 20  # Opened eagerly at startup (see pool warmup)
+MONGO_MAX_POOL_SIZE = 200
 MONGO_MAX_IDLE_TIME_MS = 30000
+MONGO_MAX_CONNECTING = 8  # Concurrent connection handshakes per pool
+MONGO_WAIT_QUEUE_TIMEOUT_MS = 2000  # Fail fast instead of queueing behind a saturated pool
 
 # File Processing
 MAX_UPLOAD_SIZE_MB = 100
@@ -0,0 +1,78 @@
+"""DataPulse - Batch Routes
+Runs several read-only API calls in one HTTP round trip
+"""
+
+from fastapi import APIRouter, HTTPException, Request, Depends, status
+from pydantic import BaseModel
+from typing import List
+import asyncio
+
+import httpx
+import orjson
+
+from auth import get_current_user
+
+router = APIRouter(prefix="/batch", tags=["Batch"])
+
+# Upper bound on sub-requests per call so one batch cannot fan out unboundedly
+MAX_BATCH_OPS = 20
+
+
+# ============ Models ============
+
+class BatchOp(BaseModel):
+    method: str = "GET"
+    path: str  # Absolute API path including the query string, e.g. /api/dashboard/stats?org_id=...
+
+
+class BatchRequest(BaseModel):
+    ops: List[BatchOp]
+
+
+# ============ Batch ============
+
+@router.post("")
+async def run_batch(
+    request: Request,
+    req: BatchRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """Dispatch GET sub-requests in-process and return their results in order"""
+    if not req.ops:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No operations given")
+    if len(req.ops) > MAX_BATCH_OPS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_OPS} operations per batch"
+        )
+    for op in req.ops:
+        if op.method.upper() != "GET":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Only GET operations can be batched, got {op.method}"
+            )
+        if not op.path.startswith("/api/") or op.path.startswith("/api/batch"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid batch path: {op.path}"
+            )
+
+    # Sub-requests go straight into the ASGI app with the caller's credentials,
+    # so they pass through the same auth, caching and error handling as
+    # individual calls without another network round trip
+    transport = httpx.ASGITransport(app=request.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url=str(request.base_url),
+        headers={"Authorization": request.headers["authorization"]}
+    ) as client:
+        responses = await asyncio.gather(*(client.get(op.path) for op in req.ops))
+
+    results = []
+    for op, response in zip(req.ops, responses):
+        if response.content and response.headers.get("content-type", "").startswith("application/json"):
+            body = orjson.loads(response.content)
+        else:
+            body = response.text
+        results.append({"path": op.path, "status": response.status_code, "body": body})
+    return {"results": results}
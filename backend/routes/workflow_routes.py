@@ -1,7 +1,7 @@
 """DataPulse - Submission Workflow Automation API"""
 from fastapi import APIRouter, HTTPException, Depends, Request
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timezone
 from bson import ObjectId
 import json
@@ -71,51 +71,104 @@ class WorkflowUpdate(BaseModel):
     priority: Optional[int] = None
 
 
-def evaluate_condition(submission_data: Dict, condition: Dict) -> bool:
-    """Evaluate a single workflow condition"""
-    field = condition.get("field")
+def _to_float(value: Any) -> Optional[float]:
+    """Coerce a value to float, returning None when it is not numeric"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _never(actual: Any) -> bool:
+    return False
+
+
+def compile_condition(condition: Dict) -> Callable[[Any], bool]:
+    """Compile a workflow condition into a predicate over the actual field value.
+
+    The expected value is coerced once here so that evaluating the same rule
+    across many submissions does not repeat the conversion on every call.
+    """
     operator = condition.get("operator")
     expected = condition.get("value")
     
-    actual = submission_data.get(field)
-    
     if operator == "equals":
-        return actual == expected
+        return lambda actual: actual == expected
     elif operator == "not_equals":
-        return actual != expected
+        return lambda actual: actual != expected
     elif operator == "contains":
-        return expected in str(actual) if actual else False
-    elif operator == "greater_than":
-        try:
-            return float(actual) > float(expected)
-        except (TypeError, ValueError):
-            return False
-    elif operator == "less_than":
-        try:
-            return float(actual) < float(expected)
-        except (TypeError, ValueError):
-            return False
+        return lambda actual: expected in str(actual) if actual else False
+    elif operator in ("greater_than", "less_than"):
+        expected_f = _to_float(expected)
+        if expected_f is None:
+            return _never
+        if operator == "greater_than":
+            def greater_than(actual: Any) -> bool:
+                actual_f = _to_float(actual)
+                return actual_f is not None and actual_f > expected_f
+            return greater_than
+        
+        def less_than(actual: Any) -> bool:
+            actual_f = _to_float(actual)
+            return actual_f is not None and actual_f < expected_f
+        return less_than
     elif operator == "is_empty":
-        return not actual
+        return lambda actual: not actual
     elif operator == "is_not_empty":
-        return bool(actual)
+        return lambda actual: bool(actual)
     elif operator == "in_list":
-        return actual in expected if isinstance(expected, list) else False
+        if not isinstance(expected, list):
+            return _never
+        return lambda actual: actual in expected
     
-    return False
+    return _never
 
 
-def evaluate_conditions(submission_data: Dict, conditions: List[Dict], logic: str) -> bool:
-    """Evaluate all workflow conditions"""
+def evaluate_condition(submission_data: Dict, condition: Dict) -> bool:
+    """Evaluate a single workflow condition"""
+    return compile_condition(condition)(submission_data.get(condition.get("field")))
+
+
+def compile_conditions(conditions: List[Dict], logic: str) -> Callable[[Dict], bool]:
+    """Compile a workflow's conditions into one predicate over submission data"""
     if not conditions:
-        return True
+        return lambda submission_data: True
     
-    results = [evaluate_condition(submission_data, c) for c in conditions]
+    compiled = [(c.get("field"), compile_condition(c)) for c in conditions]
+    combine = all if logic == "and" else any  # "or"
     
-    if logic == "and":
-        return all(results)
-    else:  # "or"
-        return any(results)
+    return lambda submission_data: combine(
+        predicate(submission_data.get(field)) for field, predicate in compiled
+    )
+
+
+def evaluate_conditions(submission_data: Dict, conditions: List[Dict], logic: str) -> bool:
+    """Evaluate all workflow conditions"""
+    return compile_conditions(conditions, logic)(submission_data)
+
+
+# Compiled predicates keyed on (workflow id, updated_at). Editing a workflow
+# bumps updated_at, so stale entries are never hit and age out at the cap.
+_compiled_workflows: Dict[tuple, Callable[[Dict], bool]] = {}
+MAX_COMPILED_WORKFLOWS = 512
+
+
+def workflow_predicate(workflow: Dict) -> Callable[[Dict], bool]:
+    """Compiled condition predicate for a workflow, reused until the workflow changes"""
+    conditions = workflow.get("conditions", [])
+    logic = workflow.get("condition_logic", "and")
+    if not workflow.get("id"):
+        return compile_conditions(conditions, logic)
+    
+    key = (workflow["id"], workflow.get("updated_at"))
+    predicate = _compiled_workflows.get(key)
+    if predicate is None:
+        predicate = compile_conditions(conditions, logic)
+        if len(_compiled_workflows) >= MAX_COMPILED_WORKFLOWS:
+            # Dicts keep insertion order, so this drops the oldest compilation
+            _compiled_workflows.pop(next(iter(_compiled_workflows)))
+        _compiled_workflows[key] = predicate
+    return predicate
 
 
 @router.get("/triggers")
@@ -444,11 +497,7 @@ async def execute_workflow(db, workflow: Dict, submission: Dict, triggered_by: s
     """Execute a workflow's actions"""
     
     # Check conditions
-    conditions_met = evaluate_conditions(
-        submission.get("data", {}),
-        workflow.get("conditions", []),
-        workflow.get("condition_logic", "and")
-    )
+    conditions_met = workflow_predicate(workflow)(submission.get("data", {}))
     
     if not conditions_met:
         return {"skipped": True, "reason": "Conditions not met"}
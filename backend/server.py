@@ -1,45 +1,112 @@
 """DataPulse - Main FastAPI Application with High-Traffic Scalability"""
-from fastapi import FastAPI, APIRouter, Request
+from fastapi import FastAPI, APIRouter, Request, Response
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 import os
+import sys
+import time
+import asyncio
+import importlib
 import logging
+import orjson
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
+
+# The event loop is chosen by the server, which creates it before importing
+# this module. Serve with uvloop (pinned in requirements.txt) via
+# `uvicorn server:app --loop uvloop --http httptools --workers $(nproc)`.
 
 # Load environment variables
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+from config.scalability import (
+    MONGO_MIN_POOL_SIZE,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MAX_IDLE_TIME_MS,
+    MONGO_MAX_CONNECTING,
+    MONGO_WAIT_QUEUE_TIMEOUT_MS
+)
+
+# Environment configuration, read once at import so misconfiguration fails fast
+MONGO_URL = os.environ['MONGO_URL']
+DB_NAME = os.environ['DB_NAME']
+# Comma-separated explicit origins. "*" (the default when unset) cannot be
+# combined with credentials per the CORS spec, so Starlette then reflects the
+# caller's Origin back, which lets any site make credentialed requests.
+# Production deployments should list their origins explicitly.
+CORS_ORIGINS = frozenset(
+    origin.strip() for origin in os.environ.get('CORS_ORIGINS', '*').split(',') if origin.strip()
+)
+# Optional regex for wildcard subdomains, e.g. r"^https://.*\.example\.org$"
+CORS_ORIGIN_REGEX = os.environ.get('CORS_ORIGIN_REGEX') or None
+MIN_POOL = int(os.environ.get('MONGO_MIN_POOL_SIZE', MONGO_MIN_POOL_SIZE))
+MAX_POOL = int(os.environ.get('MONGO_MAX_POOL_SIZE', MONGO_MAX_POOL_SIZE))
+
+# Deployment profiles. Cache, rate limiting, the job manager and the tuned
+# Mongo pool are active in every profile; profiles only trim route sets.
+SERVER_PROFILES = {
+    "full": {"analysis_routes": True},
+    "minimal": {"analysis_routes": False},  # Data capture only
+}
+SERVER_PROFILE = os.environ.get('SERVER_PROFILE', 'full')
+if SERVER_PROFILE not in SERVER_PROFILES:
+    raise RuntimeError(f"Unknown SERVER_PROFILE {SERVER_PROFILE!r}, expected one of {sorted(SERVER_PROFILES)}")
+PROFILE = SERVER_PROFILES[SERVER_PROFILE]
+
 # Scalability imports
 from utils.cache import cache, CacheConfig
 from utils.background_jobs import init_job_manager, get_job_manager
-from utils.db_optimization import create_indexes, OptimizedQueries, ConnectionPoolMonitor
+from utils.db_optimization import ensure_indexes, OptimizedQueries, ConnectionPoolMonitor, PoolStatsListener
+
+
+# Pool counters are maintained from driver events, so /health reads them for free
+pool_stats_listener = PoolStatsListener()
+
+
+def make_client() -> AsyncIOMotorClient:
+    """MongoDB client with the tuned connection pool settings"""
+    return AsyncIOMotorClient(
+        MONGO_URL,
+        minPoolSize=MIN_POOL,
+        maxPoolSize=MAX_POOL,
+        maxConnecting=MONGO_MAX_CONNECTING,
+        waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+        serverSelectionTimeoutMS=5000,
+        event_listeners=[pool_stats_listener]
+    )
+
 
 # MongoDB connection with connection pooling
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(
-    mongo_url,
-    minPoolSize=5,
-    maxPoolSize=50,
-    maxIdleTimeMS=30000,
-    serverSelectionTimeoutMS=5000
-)
-db = client[os.environ['DB_NAME']]
+client = make_client()
+db = client[DB_NAME]
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await _startup()
+    yield
+    await _shutdown()
+
 
 # Create the main app
 app = FastAPI(
     title="DataPulse API",
     description="Modern data collection platform for research, M&E, and field surveys",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Store db in app state for route access
 app.state.db = db
 app.state.optimized_queries = OptimizedQueries(db)
-app.state.pool_monitor = ConnectionPoolMonitor(client)
+app.state.pool_monitor = ConnectionPoolMonitor(client, pool_stats_listener)
 
 # Setup rate limiting
 from utils.rate_limiter import limiter, rate_limit_exceeded_handler
@@ -49,115 +116,110 @@ app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
-# Import routes
-from routes.auth_routes import router as auth_router
-from routes.org_routes import router as org_router
-from routes.project_routes import router as project_router
-from routes.form_routes import router as form_router
-from routes.submission_routes import router as submission_router
-from routes.case_routes import router as case_router
-from routes.export_routes import router as export_router
-from routes.dashboard_routes import router as dashboard_router
-from routes.media_routes import router as media_router
-from routes.gps_routes import router as gps_router
-from routes.template_routes import router as template_router
-from routes.logic_routes import router as logic_router
-from routes.widget_routes import router as widget_router
-from routes.case_import_routes import router as case_import_router
-from routes.collaboration_routes import router as collaboration_router
-from routes.duplicate_routes import router as duplicate_router
-from routes.versioning_routes import router as versioning_router
-from routes.analytics_routes import router as analytics_router
-from routes.rbac_routes import router as rbac_router
-from routes.workflow_routes import router as workflow_router
-from routes.translation_routes import router as translation_router
-from routes.security_routes import router as security_router
-from routes.admin_routes import router as admin_router
-from routes.paradata_routes import router as paradata_router
-from routes.revision_routes import router as revision_router
-from routes.dataset_routes import router as dataset_router
-from routes.survey_routes import router as survey_router
-from routes.cati_routes import router as cati_router
-from routes.backcheck_routes import router as backcheck_router
-from routes.preload_routes import router as preload_router
-from routes.quality_ai_routes import router as quality_ai_router
-from routes.cawi_routes import router as cawi_router
-from routes.simulation_routes import router as simulation_router
-from routes.device_routes import router as device_router
-from routes.analysis_routes import router as analysis_router
-from routes.stats_routes import router as stats_router
-from routes.statistics import router as statistics_modular_router
-from routes.ai_copilot_routes import router as ai_copilot_router
-from routes.analysis_export_routes import router as analysis_export_router
-from routes.report_routes import router as report_router
-from routes.reproducibility_routes import router as reproducibility_router
-from routes.survey_stats_routes import router as survey_stats_router
-from routes.advanced_models_routes import router as advanced_models_router
-from routes.dashboard_builder_routes import router as dashboard_builder_router
-from routes.audit_routes import router as audit_router
-from routes.job_routes import router as job_router
-from routes.survey360_routes import router as survey360_router
-
-# Include all route modules
-api_router.include_router(auth_router)
-api_router.include_router(org_router)
-api_router.include_router(project_router)
-api_router.include_router(form_router)
-api_router.include_router(submission_router)
-api_router.include_router(case_router)
-api_router.include_router(export_router)
-api_router.include_router(dashboard_router)
-api_router.include_router(media_router)
-api_router.include_router(gps_router)
-api_router.include_router(template_router)
-api_router.include_router(logic_router)
-api_router.include_router(widget_router)
-api_router.include_router(case_import_router)
-api_router.include_router(collaboration_router)
-api_router.include_router(duplicate_router)
-api_router.include_router(versioning_router)
-api_router.include_router(analytics_router)
-api_router.include_router(rbac_router)
-api_router.include_router(workflow_router)
-api_router.include_router(translation_router)
-api_router.include_router(security_router)
-api_router.include_router(admin_router)
-api_router.include_router(paradata_router)
-api_router.include_router(revision_router)
-api_router.include_router(dataset_router)
-api_router.include_router(survey_router)
-api_router.include_router(cati_router)
-api_router.include_router(backcheck_router)
-api_router.include_router(preload_router)
-api_router.include_router(quality_ai_router)
-api_router.include_router(cawi_router)
-api_router.include_router(simulation_router)
-api_router.include_router(device_router)
-api_router.include_router(analysis_router)
-api_router.include_router(stats_router)
-api_router.include_router(statistics_modular_router)  # New modular statistics routes
-api_router.include_router(job_router)  # Background job management
-api_router.include_router(ai_copilot_router)
-api_router.include_router(analysis_export_router)
-api_router.include_router(report_router)
-api_router.include_router(reproducibility_router)
-api_router.include_router(survey_stats_router)
-api_router.include_router(advanced_models_router)
-api_router.include_router(dashboard_builder_router)
-api_router.include_router(audit_router)
-api_router.include_router(rbac_router)
-api_router.include_router(survey360_router)  # Survey360 product routes
+# Route modules under routes/, included in order under /api
+ROUTE_MODULES = (
+    "auth_routes",
+    "org_routes",
+    "project_routes",
+    "form_routes",
+    "submission_routes",
+    "case_routes",
+    "export_routes",
+    "dashboard_routes",
+    "media_routes",
+    "gps_routes",
+    "template_routes",
+    "logic_routes",
+    "widget_routes",
+    "case_import_routes",
+    "collaboration_routes",
+    "duplicate_routes",
+    "versioning_routes",
+    "analytics_routes",
+    "rbac_routes",
+    "workflow_routes",
+    "translation_routes",
+    "security_routes",
+    "admin_routes",
+    "paradata_routes",
+    "revision_routes",
+    "dataset_routes",
+    "survey_routes",
+    "cati_routes",
+    "backcheck_routes",
+    "preload_routes",
+    "quality_ai_routes",
+    "cawi_routes",
+    "simulation_routes",
+    "device_routes",
+    "analysis_routes",
+    "stats_routes",
+    "statistics",  # Modular statistics routes
+    "job_routes",  # Background job management
+    "ai_copilot_routes",
+    "analysis_export_routes",
+    "report_routes",
+    "reproducibility_routes",
+    "survey_stats_routes",
+    "advanced_models_routes",
+    "dashboard_builder_routes",
+    "audit_routes",
+    "batch_routes",
+    "survey360_routes",  # Survey360 product routes
+)
+
+# Analysis, statistics and AI modules pull in pandas/numpy/scipy/statsmodels
+# at import time. Workers that only serve data capture can skip them with
+# a profile without analysis_routes to cut cold-start time and memory.
+ANALYSIS_ROUTE_MODULES = frozenset({
+    "simulation_routes",
+    "analysis_routes",
+    "stats_routes",
+    "statistics",
+    "ai_copilot_routes",
+    "analysis_export_routes",
+    "report_routes",
+    "reproducibility_routes",
+    "survey_stats_routes",
+    "advanced_models_routes",
+    "dashboard_builder_routes",
+})
+
+for module_name in ROUTE_MODULES:
+    if not PROFILE["analysis_routes"] and module_name in ANALYSIS_ROUTE_MODULES:
+        continue
+    api_router.include_router(importlib.import_module(f"routes.{module_name}").router)
+
+
+# Static bodies are encoded once at import instead of on every request
+_ROOT_BODY = orjson.dumps({"message": "DataPulse API is running", "version": "1.0.0"})
 
 
 # Health check endpoint
 @api_router.get("/")
 async def root():
-    return {"message": "DataPulse API is running", "version": "1.0.0"}
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
-@api_router.get("/health")
-async def health_check():
-    """Health check endpoint with cache and job queue status"""
+# Results are reused for a short window so probe storms from load
+# balancers/orchestrators collapse into one database ping per window.
+# Unhealthy results are kept too, for less time, so that during an outage
+# probes queued on the lock share one failed ping instead of each waiting
+# out their own ping timeout.
+HEALTH_CACHE_TTL = 2.0
+UNHEALTHY_CACHE_TTL = 1.0
+_health_cache = {"ts": 0.0, "ttl": 0.0, "body": None}
+_health_lock = asyncio.Lock()
+
+
+def _cached_health() -> Optional[Response]:
+    """Last health result while it is still fresh, else None"""
+    if time.monotonic() - _health_cache["ts"] < _health_cache["ttl"]:
+        return Response(_health_cache["body"], media_type="application/json")
+    return None
+
+
+async def _check_health() -> dict:
     try:
         # Test database connection
         await db.command("ping")
@@ -178,6 +240,26 @@ async def health_check():
         return {"status": "unhealthy", "database": str(e)}
 
 
+@api_router.get("/health")
+async def health_check():
+    """Health check endpoint with cache and job queue status"""
+    cached = _cached_health()
+    if cached is not None:
+        return cached
+    
+    async with _health_lock:
+        # Another probe may have refreshed the result while we waited
+        cached = _cached_health()
+        if cached is not None:
+            return cached
+        
+        result = await _check_health()
+        _health_cache["body"] = orjson.dumps(result)
+        _health_cache["ttl"] = HEALTH_CACHE_TTL if result["status"] == "healthy" else UNHEALTHY_CACHE_TTL
+        _health_cache["ts"] = time.monotonic()
+        return Response(_health_cache["body"], media_type="application/json")
+
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -185,11 +267,35 @@ app.include_router(api_router)
 from utils.redis_ha import ha_router
 app.include_router(ha_router, prefix="/api")
 
+# Short-lived response cache for read-heavy aggregate GET endpoints. CRUD
+# listings (widgets, saved reports) are left out since they must reflect
+# writes immediately. Added before CORS so that CORS stays outermost and
+# cache hits still get CORS headers.
+CACHED_GET_ENDPOINTS = (
+    "/api/dashboard/stats",
+    "/api/dashboard/submission-trends",
+    "/api/dashboard/quality-metrics",
+    "/api/dashboard/enumerator-performance",
+    "/api/dashboard/gps-locations",
+    "/api/analytics/overview/",
+    "/api/analytics/submissions/",
+    "/api/analytics/quality/",
+    "/api/analytics/performance/",
+)
+
+from utils.response_cache import ResponseCacheMiddleware
+app.add_middleware(
+    ResponseCacheMiddleware,
+    cached_endpoints=CACHED_GET_ENDPOINTS,
+    default_ttl=30
+)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+    allow_origins=list(CORS_ORIGINS),
+    allow_origin_regex=CORS_ORIGIN_REGEX,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -202,204 +308,65 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@app.on_event("startup")
-async def startup_db_client():
-    """Initialize database indexes, cache, and job queue on startup"""
-    logger.info("DataPulse API starting up with scalability features...")
-    
-    # Initialize Redis cache
+async def _init_cache():
+    await cache.connect()
+    logger.info("Cache layer initialized")
+
+
+async def _init_jobs():
+    app.state.job_manager = init_job_manager(db)
+    logger.info("Background job manager initialized")
+
+
+async def _init_database():
+    # Warm the connection pool so early requests don't pay for handshakes
     try:
-        await cache.connect()
-        logger.info("Cache layer initialized")
+        await asyncio.gather(*[db.command("ping") for _ in range(MIN_POOL)])
+        logger.info(f"MongoDB connection pool warmed ({MIN_POOL} connections)")
     except Exception as e:
-        logger.warning(f"Cache initialization failed (using memory fallback): {e}")
+        logger.warning(f"Connection pool warmup failed: {e}")
     
-    # Initialize job manager
-    try:
-        job_mgr = init_job_manager(db)
-        app.state.job_manager = job_mgr
-        logger.info("Background job manager initialized")
-    except Exception as e:
-        logger.warning(f"Job manager initialization failed: {e}")
+    # Create any missing indexes for better query performance
+    created = await ensure_indexes(db)
+    logger.info(f"Database indexes ensured ({sum(created.values())} created)")
     
-    # Create Survey360 optimized indexes
-    try:
-        from utils.db_optimization import SURVEY360_INDEXES
-        for idx_config in SURVEY360_INDEXES:
-            collection = db[idx_config["collection"]]
-            for idx in idx_config["indexes"]:
-                try:
-                    await collection.create_index(
-                        idx["keys"],
-                        name=idx.get("name"),
-                        unique=idx.get("unique", False),
-                        background=True
-                    )
-                except Exception:
-                    pass  # Index may already exist
-        logger.info("Survey360 indexes created")
-    except Exception as e:
-        logger.warning(f"Survey360 index creation warning: {e}")
+    # Create Survey360 demo user (relies on the unique email index)
+    from routes.survey360_routes import create_survey360_demo_user
+    await create_survey360_demo_user(db)
+
+
+async def _startup():
+    """Initialize database indexes, cache, and job queue on startup"""
+    logger.info(f"DataPulse API starting up with scalability features (profile: {SERVER_PROFILE})...")
     
-    # Create indexes for better query performance
-    try:
-        # Users
-        await db.users.create_index("email", unique=True)
-        await db.users.create_index("id", unique=True)
-        
-        # Organizations
-        await db.organizations.create_index("slug", unique=True)
-        await db.organizations.create_index("id", unique=True)
-        
-        # Org Members
-        await db.org_members.create_index([("org_id", 1), ("user_id", 1)], unique=True)
-        
-        # Projects
-        await db.projects.create_index("id", unique=True)
-        await db.projects.create_index([("org_id", 1), ("status", 1)])
-        
-        # Forms
-        await db.forms.create_index("id", unique=True)
-        await db.forms.create_index([("project_id", 1), ("status", 1)])
-        
-        # Submissions
-        await db.submissions.create_index("id", unique=True)
-        await db.submissions.create_index([("form_id", 1), ("submitted_at", -1)])
-        await db.submissions.create_index([("org_id", 1), ("submitted_at", -1)])
-        await db.submissions.create_index([("project_id", 1), ("status", 1)])
-        
-        # Cases
-        await db.cases.create_index("id", unique=True)
-        await db.cases.create_index([("project_id", 1), ("respondent_id", 1)], unique=True)
-        
-        # Audit Logs
-        await db.audit_logs.create_index([("org_id", 1), ("timestamp", -1)])
-        
-        # API Keys
-        await db.api_keys.create_index("key_hash", unique=True)
-        await db.api_keys.create_index([("org_id", 1), ("is_active", 1)])
-        
-        # API Audit Logs
-        await db.api_audit_logs.create_index([("org_id", 1), ("timestamp", -1)])
-        await db.api_audit_logs.create_index([("timestamp", -1)])
-        
-        # Invoices
-        await db.invoices.create_index("id", unique=True)
-        await db.invoices.create_index([("org_id", 1), ("created_at", -1)])
-        
-        # Billing Events
-        await db.billing_events.create_index([("org_id", 1), ("timestamp", -1)])
-        
-        # Paradata Sessions
-        await db.paradata_sessions.create_index("id", unique=True)
-        await db.paradata_sessions.create_index([("submission_id", 1)])
-        await db.paradata_sessions.create_index([("enumerator_id", 1), ("session_start", -1)])
-        await db.paradata_sessions.create_index([("form_id", 1), ("session_start", -1)])
-        
-        # Submission Revisions
-        await db.submission_revisions.create_index("id", unique=True)
-        await db.submission_revisions.create_index([("submission_id", 1), ("version", 1)])
-        
-        # Revision Audit Trail
-        await db.revision_audit_trail.create_index([("submission_id", 1), ("timestamp", 1)])
-        
-        # Correction Requests
-        await db.correction_requests.create_index("id", unique=True)
-        await db.correction_requests.create_index([("enumerator_id", 1), ("status", 1)])
-        
-        # Lookup Datasets
-        await db.lookup_datasets.create_index("id", unique=True)
-        await db.lookup_datasets.create_index([("org_id", 1), ("is_active", 1)])
-        
-        # Dataset Write-back Log
-        await db.dataset_write_back_log.create_index([("dataset_id", 1), ("timestamp", -1)])
-        
-        # Survey Distributions (Token/Panel Surveys)
-        await db.survey_distributions.create_index("id", unique=True)
-        await db.survey_distributions.create_index([("org_id", 1), ("status", 1)])
-        await db.survey_invites.create_index("id", unique=True)
-        await db.survey_invites.create_index("token_hash", unique=True)
-        await db.survey_invites.create_index([("distribution_id", 1), ("status", 1)])
-        await db.survey_panels.create_index("id", unique=True)
-        await db.panel_members.create_index("id", unique=True)
-        await db.panel_members.create_index([("panel_id", 1), ("status", 1)])
-        
-        # CATI (Computer-Assisted Telephone Interviewing)
-        await db.cati_projects.create_index("id", unique=True)
-        await db.cati_projects.create_index([("org_id", 1), ("status", 1)])
-        await db.cati_queue.create_index("id", unique=True)
-        await db.cati_queue.create_index([("project_id", 1), ("status", 1), ("priority", -1)])
-        await db.cati_queue.create_index([("locked_by", 1), ("status", 1)])
-        await db.cati_calls.create_index("id", unique=True)
-        await db.cati_calls.create_index([("project_id", 1), ("start_time", -1)])
-        await db.cati_calls.create_index([("interviewer_id", 1), ("start_time", -1)])
-        
-        # Back-check Module
-        await db.backcheck_configs.create_index("id", unique=True)
-        await db.backcheck_configs.create_index([("org_id", 1), ("project_id", 1)])
-        await db.backchecks.create_index("id", unique=True)
-        await db.backchecks.create_index([("config_id", 1), ("status", 1)])
-        await db.backchecks.create_index([("assigned_to", 1), ("status", 1)])
-        await db.backchecks.create_index([("original_enumerator_id", 1)])
-        await db.enumerator_quality.create_index("enumerator_id", unique=True)
-        
-        # Preload/Write-back
-        await db.preload_configs.create_index("id", unique=True)
-        await db.preload_configs.create_index([("org_id", 1), ("form_id", 1)])
-        await db.writeback_configs.create_index("id", unique=True)
-        await db.writeback_configs.create_index([("org_id", 1), ("form_id", 1)])
-        await db.preload_logs.create_index([("form_id", 1), ("timestamp", -1)])
-        await db.writeback_logs.create_index([("form_id", 1), ("timestamp", -1)])
-        await db.external_api_configs.create_index("id", unique=True)
-        
-        # Quality AI Monitoring
-        await db.speeding_configs.create_index("id", unique=True)
-        await db.speeding_configs.create_index([("org_id", 1), ("form_id", 1)])
-        await db.audio_audit_configs.create_index("id", unique=True)
-        await db.audio_audit_configs.create_index([("org_id", 1), ("form_id", 1)])
-        await db.ai_monitoring_configs.create_index("id", unique=True)
-        await db.ai_monitoring_configs.create_index("org_id")
-        await db.quality_alerts.create_index("id", unique=True)
-        await db.quality_alerts.create_index([("org_id", 1), ("status", 1)])
-        await db.quality_alerts.create_index([("submission_id", 1), ("alert_type", 1)])
-        await db.ai_analyses.create_index([("submission_id", 1)])
-        
-        # CAWI Sessions
-        await db.cawi_sessions.create_index("id", unique=True)
-        await db.cawi_sessions.create_index([("form_id", 1), ("token", 1)])
-        await db.cawi_sessions.create_index([("form_id", 1), ("status", 1)])
-        
-        # AI Field Simulation
-        await db.simulation_reports.create_index("id", unique=True)
-        await db.simulation_reports.create_index([("org_id", 1), ("form_id", 1)])
-        await db.simulation_reports.create_index([("created_at", -1)])
-        
-        # Device Management & Remote Wipe
-        await db.devices.create_index("id", unique=True)
-        await db.devices.create_index([("org_id", 1), ("user_id", 1)])
-        await db.devices.create_index([("org_id", 1), ("status", 1)])
-        await db.device_activity_logs.create_index([("device_id", 1), ("timestamp", -1)])
-        await db.device_activity_logs.create_index([("org_id", 1), ("timestamp", -1)])
-        
-        logger.info("Database indexes created successfully")
-        
-        # Create Survey360 demo user
-        from routes.survey360_routes import create_survey360_demo_user
-        await create_survey360_demo_user(db)
-        
-    except Exception as e:
-        logger.error(f"Error creating indexes: {e}")
+    # Import cost dominates cold start; precompile with
+    # `python -m compileall -q -j 0 backend` at build time so imports only
+    # unmarshal .pyc files (set PYTHONPYCACHEPREFIX if the tree is read-only)
+    route_count = sum(1 for name in sys.modules if name.startswith("routes."))
+    logger.info(f"{len(sys.modules)} modules imported ({route_count} route modules)")
+    if sys.dont_write_bytecode:
+        logger.warning("Bytecode caching is disabled; route modules are recompiled on every start")
+    
+    # The steps are independent, so startup takes as long as the slowest one
+    steps = [
+        (_init_cache, "Cache initialization failed (using memory fallback)"),
+        (_init_jobs, "Job manager initialization failed"),
+        (_init_database, "Error creating indexes"),
+    ]
+    results = await asyncio.gather(*[step() for step, _ in steps], return_exceptions=True)
+    for (_, message), result in zip(steps, results):
+        if isinstance(result, Exception):
+            logger.warning(f"{message}: {result}")
 
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
+async def _shutdown():
     """Cleanup on shutdown"""
     logger.info("DataPulse API shutting down...")
     
-    # Close cache connection
+    # Close cache connection; a failure must not keep the database client open
     try:
         await cache.close()
-    except Exception:
-        pass
+    except Exception as e:
+        logger.warning(f"Cache close failed: {e}")
     
     client.close()
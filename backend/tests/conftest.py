@@ -0,0 +1,351 @@
+"""
+Shared pytest fixtures for the DataPulse backend test suite
+
+pytest.ini runs the test modules across xdist workers; session-scoped fixtures
+are created once per worker, and logins and created test resources are shared
+between workers on disk.
+
+Compute-heavy and record-creating tests are marked slow; for a quick loop run:
+pytest -m "not slow"
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import re
+import time
+from types import MappingProxyType
+
+import httpx
+import pytest
+import requests
+from filelock import FileLock
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# The concurrent request helpers build their own event loop per call; it is
+# a libuv one when uvloop is installed, without touching the global policy
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Login tokens are shared between xdist workers for this many seconds
+TOKEN_TTL = 600
+
+# Default account used by modules that do not log in as someone else
+DEMO_EMAIL = "demo@datapulse.io"
+DEMO_PASSWORD = "Test123!"
+DEMO_ORG_ID = "a07e901a-bd5f-450d-8533-ed4f7ec629a5"
+
+# QA account most feature modules log in as
+TEST_USER_EMAIL = "test@datapulse.io"
+TEST_USER_PASSWORD = "password123"
+
+# Last recorded call duration per test id, summed to start long modules first
+DURATIONS_CACHE_KEY = "datapulse/durations_v1"
+# Modules holding these long poles start first until real durations are recorded
+LONG_POLES = ("test_form_crud", "test_create_cati_project", "test_create_backcheck_config")
+
+_durations = {}
+
+
+def make_session():
+    """Create a pooled session that keeps connections alive across tests"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _run(coro):
+    """Run a coroutine to completion on a fresh uvloop loop, or asyncio's default"""
+    if uvloop is None or not hasattr(asyncio, "Runner"):
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
+def _request_concurrently(base_url, headers, method, requests_, stream=False):
+    """Send (url, json payload or None) requests at once and return responses in order
+
+    With stream=True each body is counted in 64 KiB chunks instead of being
+    held in memory, and (response, body size) pairs are returned.
+    """
+    async def send(client, url, payload):
+        if not stream:
+            return await client.request(method, url, json=payload)
+        async with client.stream(method, url, json=payload) as response:
+            size = 0
+            async for chunk in response.aiter_bytes(65536):
+                size += len(chunk)
+            return response, size
+
+    async def run():
+        async with httpx.AsyncClient(
+            base_url=base_url,
+            http2=True,
+            headers=headers,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0
+        ) as client:
+            return await asyncio.gather(*(send(client, url, payload) for url, payload in requests_))
+    return _run(run())
+
+
+def pytest_sessionstart(session):
+    """Probe the backend once and stop the run early if it is not healthy"""
+    # Workers inherit the controller's verdict; only probe once per run
+    if hasattr(session.config, "workerinput"):
+        return
+    url = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+    if not url:
+        return
+    try:
+        response = requests.get(f"{url}/api/health", timeout=10)
+        data = response.json()
+    except (requests.RequestException, ValueError) as e:
+        pytest.exit(f"Backend health check failed: {e}", returncode=3)
+    if response.status_code != 200 or data.get("status") != "healthy" or data.get("database") != "connected":
+        pytest.exit(f"Backend unhealthy: {response.status_code} {data}", returncode=3)
+
+
+def _module_of(nodeid):
+    """Test file a node id belongs to"""
+    return nodeid.split("::", 1)[0]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Start the longest modules first so xdist workers finish close together"""
+    # Runs before xdist reads the groups. Each module is one group, which is
+    # what loadfile would do, so classes sharing state stay on one worker;
+    # modules marked xdist_per_class get one group per class instead.
+    if config.getoption("dist", "no") == "loadgroup":
+        for item in items:
+            group = _module_of(item.nodeid)
+            if item.get_closest_marker("xdist_per_class") and getattr(item, "cls", None):
+                group = f"{group}::{item.cls.__name__}"
+            item.add_marker(pytest.mark.xdist_group(group))
+    
+    durations = config.cache.get(DURATIONS_CACHE_KEY, {})
+    totals = {}
+    for item in items:
+        if durations:
+            weight = durations.get(item.nodeid, 0.0)
+        else:
+            weight = float(getattr(item, "originalname", item.name) in LONG_POLES)
+        module = _module_of(item.nodeid)
+        totals[module] = totals.get(module, 0.0) + weight
+    # Whole modules move and the sort is stable, so tests keep their collection
+    # order within a module: test_01 -> test_02 chains and module- and
+    # class-scoped fixtures are untouched
+    items.sort(key=lambda item: -totals[_module_of(item.nodeid)])
+
+
+def pytest_runtest_logreport(report):
+    """Remember how long each test body took"""
+    if report.when == "call":
+        # Drop the @group suffix loadgroup appends, to match collection-time ids
+        _durations[re.sub(r"@[^\[\]]*$", "", report.nodeid)] = report.duration
+
+
+def pytest_sessionfinish(session):
+    """Persist durations for the next run's ordering"""
+    # Only the controller writes, so every worker collects in the same order
+    if hasattr(session.config, "workerinput") or not _durations:
+        return
+    durations = session.config.cache.get(DURATIONS_CACHE_KEY, {})
+    durations.update(_durations)
+    session.config.cache.set(DURATIONS_CACHE_KEY, durations)
+
+
+@pytest.fixture(scope="session")
+def base_url():
+    """Backend under test; skip instead of hitting an empty host when unset"""
+    url = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+    if not url:
+        pytest.skip("REACT_APP_BACKEND_URL not set")
+    return url
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Unauthenticated session shared by every test in the run"""
+    session = make_session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def cached_login(tmp_path_factory, http_session):
+    """Log in once per (backend, user) and share the token across workers"""
+    root = tmp_path_factory.getbasetemp()
+    # Under xdist every worker gets its own basetemp below a common per-run
+    # parent; a serial run's parent outlives the run, so stay in basetemp
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        root = root.parent
+
+    def login(base_url, email, password):
+        key = hashlib.sha256(f"{base_url}|{email}".encode()).hexdigest()[:16]
+        path = root / f"auth_token_{key}.json"
+        with FileLock(f"{path}.lock"):
+            if path.is_file():
+                cached = json.loads(path.read_text())
+                if cached["exp"] > time.time():
+                    return cached["token"]
+            response = http_session.post(
+                f"{base_url}/api/auth/login",
+                json={"email": email, "password": password}
+            )
+            if response.status_code != 200:
+                pytest.skip(f"Authentication failed: {response.status_code}")
+            data = response.json()
+            token = data.get("token") or data.get("access_token")
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"token": token, "exp": time.time() + TOKEN_TTL}))
+            os.replace(tmp, path)
+            return token
+
+    return login
+
+
+@pytest.fixture(scope="session")
+def worker_shared(tmp_path_factory):
+    """Compute a JSON value once per run and share it between xdist workers"""
+    root = tmp_path_factory.getbasetemp()
+    # Only the per-run parent is shared; a serial run's parent outlives the run
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        root = root.parent
+
+    def get(name, create):
+        key = hashlib.sha256(name.encode()).hexdigest()[:16]
+        path = root / f"shared_{key}.json"
+        with FileLock(f"{path}.lock"):
+            if path.is_file():
+                return json.loads(path.read_text())
+            value = create()
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(value))
+            os.replace(tmp, path)
+            return value
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def auth_token(base_url, cached_login):
+    """Demo account token, logged in once for the whole run"""
+    return cached_login(base_url, DEMO_EMAIL, DEMO_PASSWORD)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(auth_token):
+    """Return auth headers, read-only since every module in the run shares them"""
+    return MappingProxyType({"Authorization": f"Bearer {auth_token}"})
+
+
+@pytest.fixture(scope="session")
+def test_user_token(base_url, cached_login):
+    """QA account token, logged in once for the whole run"""
+    return cached_login(base_url, TEST_USER_EMAIL, TEST_USER_PASSWORD)
+
+
+@pytest.fixture(scope="session")
+def test_user_headers(test_user_token):
+    """Auth headers for the QA account, read-only since every module in the run shares them"""
+    return MappingProxyType({"Authorization": f"Bearer {test_user_token}"})
+
+
+@pytest.fixture(scope="session")
+def http(base_url, auth_headers):
+    """Authenticated HTTP/2 client for the demo account, rooted at the backend"""
+    with httpx.Client(
+        base_url=base_url,
+        http2=True,
+        headers=auth_headers,
+        timeout=30.0
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def roles_response(http):
+    """Roles of the demo organization, fetched once and indexed by id"""
+    response = http.get(f"/api/rbac/roles/{DEMO_ORG_ID}")
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+    data = response.json()
+    roles = data.get("roles", [])
+    # Index once so tests look roles and permissions up in O(1)
+    return {
+        "raw": data,
+        "by_id": {role["id"]: role for role in roles},
+        "default_ids": {role["id"] for role in roles if role.get("is_default")},
+        "permissions": {role["id"]: set(role.get("permissions", [])) for role in roles},
+    }
+
+
+@pytest.fixture(scope="session")
+def post_concurrently(base_url, auth_headers):
+    """Send independent POSTs for the demo account in one round of latency"""
+    return functools.partial(_request_concurrently, base_url, auth_headers, "POST")
+
+
+@pytest.fixture(scope="session")
+def test_user_request_concurrently(base_url, test_user_headers):
+    """Send independent requests of one method for the QA account in one round of latency"""
+    return functools.partial(_request_concurrently, base_url, test_user_headers)
+
+
+@pytest.fixture(scope="session")
+def test_user_post_concurrently(test_user_request_concurrently):
+    """Send independent POSTs for the QA account in one round of latency"""
+    return functools.partial(test_user_request_concurrently, "POST")
+
+
+@pytest.fixture(scope="session")
+def stats_data_available(http):
+    """Whether the demo organization has any submissions to analyse"""
+    response = http.get("/api/dashboard/stats", params={"org_id": DEMO_ORG_ID})
+    return response.status_code == 200 and response.json().get("total_submissions", 0) > 0
+
+
+@pytest.fixture(scope="session")
+def demo_form_id(http):
+    """A form in the demo organization, looked up once per run; DEMO_FORM_ID skips the lookup"""
+    form_id = os.environ.get("DEMO_FORM_ID")
+    if form_id:
+        return form_id
+    response = http.get("/api/forms", params={"org_id": DEMO_ORG_ID})
+    forms = response.json() if response.status_code == 200 else []
+    return forms[0].get("id") if forms else None
+
+
+@pytest.fixture(autouse=True)
+def _skip_if_no_data(request):
+    """Skip requires_data tests when the probe finds nothing to analyse"""
+    if request.node.get_closest_marker("requires_data") is None:
+        return
+    if not request.getfixturevalue("stats_data_available"):
+        pytest.skip("demo organization has no submissions")
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """Recording settings for @pytest.mark.vcr tests; credentials never reach a cassette"""
+    return {"filter_headers": ["authorization"], "decode_compressed_response": True}
+
+
+@pytest.fixture(scope="session")
+def rbac_permissions(http):
+    """Permission catalog, fetched live once per run"""
+    response = http.get("/api/rbac/permissions")
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+    return response.json()
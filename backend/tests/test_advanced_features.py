@@ -3,21 +3,29 @@ DataPulse Advanced Features Tests - Iteration 5
 Tests: Templates, Logic Engine (Calculate, Skip Logic), GPS endpoints
 """
 
-import pytest
-import requests
 import os
 
+import pytest
+
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', 'https://manual-preview.preview.emergentagent.com').rstrip('/')
 
+TEMPLATES_URL = f"{BASE_URL}/api/templates/"
+CALCULATE_URL = f"{BASE_URL}/api/logic/calculate"
+OPERATORS_URL = f"{BASE_URL}/api/logic/operators"
+FUNCTIONS_URL = f"{BASE_URL}/api/logic/functions"
+SKIP_LOGIC_URL = f"{BASE_URL}/api/logic/validate-skip-logic"
+GPS_POINTS_URL = f"{BASE_URL}/api/gps/points?org_id=test-org&days=30"
+GPS_CLUSTERS_URL = f"{BASE_URL}/api/gps/clusters?org_id=test-org&days=30"
+GPS_COVERAGE_URL = f"{BASE_URL}/api/gps/coverage?org_id=test-org&days=30"
+
 
 class TestTemplatesAPI:
     """Tests for /api/templates/ endpoints"""
     
-    def test_list_templates(self):
+    def test_list_templates(self, http_session):
         """Test listing all templates"""
-        response = requests.get(f"{BASE_URL}/api/templates/")
+        response = http_session.get(TEMPLATES_URL)
         assert response.status_code == 200
-        
         data = response.json()
         assert isinstance(data, list)
         assert len(data) >= 5  # Should have at least 5 pre-defined templates
@@ -32,11 +40,10 @@ class TestTemplatesAPI:
         assert "field_count" in template
         print(f"✓ Templates endpoint returns {len(data)} templates")
     
-    def test_list_categories(self):
+    def test_list_categories(self, http_session):
         """Test listing template categories"""
-        response = requests.get(f"{BASE_URL}/api/templates/categories")
+        response = http_session.get(TEMPLATES_URL + "categories")
         assert response.status_code == 200
-        
         data = response.json()
         assert isinstance(data, list)
         assert len(data) >= 5  # Should have 5 categories
@@ -46,11 +53,10 @@ class TestTemplatesAPI:
             assert cat in data, f"Category '{cat}' not found"
         print(f"✓ Categories endpoint returns {len(data)} categories")
     
-    def test_get_template_by_id(self):
+    def test_get_template_by_id(self, http_session):
         """Test getting a specific template by ID"""
-        response = requests.get(f"{BASE_URL}/api/templates/household-survey")
+        response = http_session.get(TEMPLATES_URL + "household-survey")
         assert response.status_code == 200
-        
         data = response.json()
         assert data["id"] == "household-survey"
         assert data["name"] == "Household Survey"
@@ -58,17 +64,16 @@ class TestTemplatesAPI:
         assert len(data["fields"]) == 8
         print(f"✓ Template by ID returns full template with {len(data['fields'])} fields")
     
-    def test_get_nonexistent_template(self):
+    def test_get_nonexistent_template(self, http_session):
         """Test getting a non-existent template returns 404"""
-        response = requests.get(f"{BASE_URL}/api/templates/nonexistent-template")
+        response = http_session.get(TEMPLATES_URL + "nonexistent-template")
         assert response.status_code == 404
         print("✓ Non-existent template correctly returns 404")
     
-    def test_filter_templates_by_category(self):
+    def test_filter_templates_by_category(self, http_session):
         """Test filtering templates by category"""
-        response = requests.get(f"{BASE_URL}/api/templates/?category=Health")
+        response = http_session.get(TEMPLATES_URL + "?category=Health")
         assert response.status_code == 200
-        
         data = response.json()
         assert len(data) >= 1
         for template in data:
@@ -79,78 +84,39 @@ class TestTemplatesAPI:
 class TestLogicCalculateAPI:
     """Tests for /api/logic/calculate endpoint - Calculated fields evaluation"""
     
-    def test_basic_math_expression(self):
-        """Test basic mathematical calculation"""
-        response = requests.post(
-            f"{BASE_URL}/api/logic/calculate",
-            json={"expression": "10 + 5 * 2", "values": {}}
-        )
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert data["result"] == 20
-        print("✓ Basic math expression evaluated correctly")
-    
-    def test_bmi_calculation_with_values(self):
-        """Test BMI calculation with field values"""
-        response = requests.post(
-            f"{BASE_URL}/api/logic/calculate",
-            json={
-                "expression": "round(weight / pow(height/100, 2), 1)",
-                "values": {"weight": 70, "height": 175}
-            }
+    @pytest.mark.parametrize("expression,values,expected,expected_type", [
+        pytest.param("10 + 5 * 2", {}, 20, None, id="basic_math"),
+        # BMI = 70 / (1.75^2) ≈ 22.86
+        pytest.param("round(weight / pow(height/100, 2), 1)", {"weight": 70, "height": 175},
+                     22.9, "float", id="bmi_with_values"),
+        pytest.param("round(3.14159, 2)", {}, 3.14, None, id="round"),
+        pytest.param("min(5, 3, 8)", {}, 3, None, id="min"),
+        pytest.param("max(5, 3, 8)", {}, 8, None, id="max"),
+        pytest.param("sqrt(16)", {}, 4.0, None, id="sqrt"),
+        # Backend returns null for invalid expressions instead of 400
+        pytest.param("invalid_function()", {}, None, None, id="invalid_returns_null"),
+    ])
+    def test_calculate(self, http_session, expression, values, expected, expected_type):
+        """Test calculated field expressions evaluate to the expected result"""
+        response = http_session.post(
+            CALCULATE_URL,
+            json={"expression": expression, "values": values}
         )
         assert response.status_code == 200
         
         data = response.json()
-        assert data["result"] == 22.9  # BMI = 70 / (1.75^2) ≈ 22.86
-        assert data["type"] == "float"
-        print(f"✓ BMI calculation with values: {data['result']}")
-    
-    def test_round_function(self):
-        """Test round function"""
-        response = requests.post(
-            f"{BASE_URL}/api/logic/calculate",
-            json={"expression": "round(3.14159, 2)", "values": {}}
-        )
-        assert response.status_code == 200
-        assert response.json()["result"] == 3.14
-        print("✓ Round function works correctly")
+        assert data["result"] == expected
+        if expected_type:
+            assert data["type"] == expected_type
+        print(f"✓ {expression} = {data['result']}")
     
-    def test_min_max_functions(self):
-        """Test min and max functions"""
-        response = requests.post(
-            f"{BASE_URL}/api/logic/calculate",
-            json={"expression": "min(5, 3, 8)", "values": {}}
-        )
-        assert response.status_code == 200
-        assert response.json()["result"] == 3
-        
-        response = requests.post(
-            f"{BASE_URL}/api/logic/calculate",
-            json={"expression": "max(5, 3, 8)", "values": {}}
-        )
-        assert response.status_code == 200
-        assert response.json()["result"] == 8
-        print("✓ Min/Max functions work correctly")
-    
-    def test_sqrt_function(self):
-        """Test square root function"""
-        response = requests.post(
-            f"{BASE_URL}/api/logic/calculate",
-            json={"expression": "sqrt(16)", "values": {}}
-        )
-        assert response.status_code == 200
-        assert response.json()["result"] == 4.0
-        print("✓ Sqrt function works correctly")
-    
-    def test_conditional_if_function(self):
+    def test_conditional_if_function(self, http_session):
         """Test conditional if function - Note: if function returns null (known limitation)"""
         # Note: The if() function in the calculation engine returns null
         # This is a known limitation - the if function is defined but doesn't evaluate correctly
         # due to Python eval limitations with conditional expressions
-        response = requests.post(
-            f"{BASE_URL}/api/logic/calculate",
+        response = http_session.post(
+            CALCULATE_URL,
             json={
                 "expression": "if(75 >= 50, 1, 0)",
                 "values": {}
@@ -160,27 +126,15 @@ class TestLogicCalculateAPI:
         # The if function currently returns null - this is a known issue to report
         # For now, we verify it doesn't crash the API
         print(f"✓ Conditional if function called (returns: {response.json()['result']} - known limitation)")
-    
-    def test_invalid_expression_returns_null(self):
-        """Test invalid expression returns null result (graceful handling)"""
-        response = requests.post(
-            f"{BASE_URL}/api/logic/calculate",
-            json={"expression": "invalid_function()", "values": {}}
-        )
-        assert response.status_code == 200
-        # Backend returns null for invalid expressions instead of 400
-        assert response.json()["result"] is None
-        print("✓ Invalid expression returns null result (graceful handling)")
 
 
 class TestLogicOperatorsAPI:
     """Tests for /api/logic/operators endpoint"""
     
-    def test_get_operators_list(self):
+    def test_get_operators_list(self, http_session):
         """Test getting list of available operators"""
-        response = requests.get(f"{BASE_URL}/api/logic/operators")
+        response = http_session.get(OPERATORS_URL)
         assert response.status_code == 200
-        
         data = response.json()
         assert "operators" in data
         assert len(data["operators"]) == 12  # 12 operators defined
@@ -197,10 +151,10 @@ class TestLogicOperatorsAPI:
 class TestValidateSkipLogicAPI:
     """Tests for /api/logic/validate-skip-logic endpoint"""
     
-    def test_equals_operator(self):
+    def test_equals_operator(self, http_session):
         """Test equals operator in skip logic"""
-        response = requests.post(
-            f"{BASE_URL}/api/logic/validate-skip-logic",
+        response = http_session.post(
+            SKIP_LOGIC_URL,
             json={
                 "logic": {
                     "type": "and",
@@ -215,8 +169,8 @@ class TestValidateSkipLogicAPI:
         print("✓ Skip logic equals operator works (visible)")
         
         # Test when not matching
-        response = requests.post(
-            f"{BASE_URL}/api/logic/validate-skip-logic",
+        response = http_session.post(
+            SKIP_LOGIC_URL,
             json={
                 "logic": {
                     "type": "and",
@@ -229,10 +183,10 @@ class TestValidateSkipLogicAPI:
         assert response.json()["is_visible"] == False
         print("✓ Skip logic equals operator works (hidden)")
     
-    def test_greater_than_operator(self):
+    def test_greater_than_operator(self, http_session):
         """Test greater than operator in skip logic"""
-        response = requests.post(
-            f"{BASE_URL}/api/logic/validate-skip-logic",
+        response = http_session.post(
+            SKIP_LOGIC_URL,
             json={
                 "logic": {
                     "type": "and",
@@ -245,10 +199,10 @@ class TestValidateSkipLogicAPI:
         assert response.json()["is_visible"] == True
         print("✓ Skip logic >= operator works (25 >= 18)")
     
-    def test_and_logic(self):
+    def test_and_logic(self, http_session):
         """Test AND logic with multiple conditions"""
-        response = requests.post(
-            f"{BASE_URL}/api/logic/validate-skip-logic",
+        response = http_session.post(
+            SKIP_LOGIC_URL,
             json={
                 "logic": {
                     "type": "and",
@@ -264,10 +218,10 @@ class TestValidateSkipLogicAPI:
         assert response.json()["is_visible"] == True
         print("✓ AND logic with 2 conditions works (both true)")
     
-    def test_or_logic(self):
+    def test_or_logic(self, http_session):
         """Test OR logic with multiple conditions"""
-        response = requests.post(
-            f"{BASE_URL}/api/logic/validate-skip-logic",
+        response = http_session.post(
+            SKIP_LOGIC_URL,
             json={
                 "logic": {
                     "type": "or",
@@ -287,9 +241,9 @@ class TestValidateSkipLogicAPI:
 class TestGPSAPI:
     """Tests for /api/gps/* endpoints"""
     
-    def test_get_gps_points(self):
+    def test_get_gps_points(self, http_session):
         """Test getting GPS points"""
-        response = requests.get(f"{BASE_URL}/api/gps/points?org_id=test-org&days=30")
+        response = http_session.get(GPS_POINTS_URL)
         assert response.status_code == 200
         
         data = response.json()
@@ -299,9 +253,9 @@ class TestGPSAPI:
         assert isinstance(data["points"], list)
         print(f"✓ GPS points endpoint returns {data['count']} points")
     
-    def test_get_gps_clusters(self):
+    def test_get_gps_clusters(self, http_session):
         """Test getting GPS clusters"""
-        response = requests.get(f"{BASE_URL}/api/gps/clusters?org_id=test-org&days=30")
+        response = http_session.get(GPS_CLUSTERS_URL)
         assert response.status_code == 200
         
         data = response.json()
@@ -310,9 +264,9 @@ class TestGPSAPI:
         assert "cluster_count" in data
         print(f"✓ GPS clusters endpoint returns {data['cluster_count']} clusters")
     
-    def test_get_gps_coverage(self):
+    def test_get_gps_coverage(self, http_session):
         """Test getting GPS coverage stats"""
-        response = requests.get(f"{BASE_URL}/api/gps/coverage?org_id=test-org&days=30")
+        response = http_session.get(GPS_COVERAGE_URL)
         assert response.status_code == 200
         
         data = response.json()
@@ -326,11 +280,10 @@ class TestGPSAPI:
 class TestLogicFunctionsAPI:
     """Tests for /api/logic/functions endpoint"""
     
-    def test_get_functions_list(self):
+    def test_get_functions_list(self, http_session):
         """Test getting list of available calculation functions"""
-        response = requests.get(f"{BASE_URL}/api/logic/functions")
+        response = http_session.get(FUNCTIONS_URL)
         assert response.status_code == 200
-        
         data = response.json()
         assert "functions" in data
         assert "examples" in data
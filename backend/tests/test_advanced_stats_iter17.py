@@ -3,41 +3,60 @@ Phase 2 Advanced Statistics Module Tests - Iteration 17
 Tests T-Test, ANOVA, Correlation, and Regression endpoints
 """
 
+import functools
+import httpx
+import orjson
 import pytest
-import requests
 import os
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
-# Test credentials
-TEST_USER = "test@datapulse.io"
-TEST_PASSWORD = "password123"
 ORG_ID = "ad326e2a-f7a4-4b3f-b4d2-0e1ba0fd9fbd"
 FORM_ID = "124427aa-d482-4292-af6e-2042ae5cabbd"
 
+ANOVA_URL = f"{BASE_URL}/api/statistics/anova"
+CORRELATION_URL = f"{BASE_URL}/api/statistics/correlation"
+REGRESSION_URL = f"{BASE_URL}/api/statistics/regression"
+TTEST_URL = f"{BASE_URL}/api/statistics/ttest"
+DESCRIPTIVES_URL = f"{BASE_URL}/api/statistics/descriptives"
+
+
+def _body(**fields):
+    """Serialize a statistics request for the shared test form"""
+    return orjson.dumps({"form_id": FORM_ID, "org_id": ORG_ID, **fields})
+
+
+# The correlation tests differ only in method, so encode each variant once
+CORRELATION_BODIES = {
+    method: _body(variables=["satisfaction", "age"], method=method)
+    for method in ("pearson", "spearman", "kendall")
+}
+
 
 @pytest.fixture(scope="module")
-def auth_token():
-    """Get authentication token for tests"""
-    response = requests.post(
-        f"{BASE_URL}/api/auth/login",
-        json={"email": TEST_USER, "password": TEST_PASSWORD},
-        headers={"Content-Type": "application/json"}
-    )
-    if response.status_code == 200:
-        return response.json().get("access_token")
-    pytest.skip(f"Authentication failed: {response.status_code}")
+def api_client(test_user_token):
+    """Create authenticated HTTP/2 client"""
+    with httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        timeout=30.0,
+        headers={
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {test_user_token}"
+        }
+    ) as client:
+        yield client
 
 
 @pytest.fixture(scope="module")
-def api_client(auth_token):
-    """Create authenticated session"""
-    session = requests.Session()
-    session.headers.update({
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {auth_token}"
-    })
-    return session
+def correlation_response(api_client):
+    """Fetch each correlation method once per module and keep the parsed body"""
+    @functools.lru_cache(maxsize=None)
+    def fetch(method):
+        response = api_client.post(CORRELATION_URL, content=CORRELATION_BODIES[method])
+        assert response.status_code == 200, f"Correlation failed: {response.text}"
+        return response.json()
+    return fetch
 
 
 # ==================== ANOVA Tests ====================
@@ -45,17 +64,16 @@ def api_client(auth_token):
 class TestANOVA:
     """Tests for ANOVA endpoint - /api/statistics/anova"""
     
+    @pytest.mark.slow
     def test_anova_with_post_hoc(self, api_client):
         """Test ANOVA with post-hoc Tukey tests"""
         response = api_client.post(
-            f"{BASE_URL}/api/statistics/anova",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "dependent_var": "satisfaction",
-                "factor_var": "gender",
-                "post_hoc": True
-            }
+            ANOVA_URL,
+            content=_body(
+                dependent_var="satisfaction",
+                factor_var="gender",
+                post_hoc=True
+            )
         )
         
         assert response.status_code == 200, f"ANOVA failed: {response.text}"
@@ -93,14 +111,12 @@ class TestANOVA:
     def test_anova_without_post_hoc(self, api_client):
         """Test ANOVA without post-hoc tests"""
         response = api_client.post(
-            f"{BASE_URL}/api/statistics/anova",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "dependent_var": "satisfaction",
-                "factor_var": "gender",
-                "post_hoc": False
-            }
+            ANOVA_URL,
+            content=_body(
+                dependent_var="satisfaction",
+                factor_var="gender",
+                post_hoc=False
+            )
         )
         
         assert response.status_code == 200, f"ANOVA failed: {response.text}"
@@ -113,16 +129,13 @@ class TestANOVA:
     def test_anova_missing_variable(self, api_client):
         """Test ANOVA with missing variable"""
         response = api_client.post(
-            f"{BASE_URL}/api/statistics/anova",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "dependent_var": "nonexistent_var",
-                "factor_var": "gender",
-                "post_hoc": True
-            }
+            ANOVA_URL,
+            content=_body(
+                dependent_var="nonexistent_var",
+                factor_var="gender",
+                post_hoc=True
+            )
         )
-        
         assert response.status_code == 400, "Should reject missing variable"
 
 
@@ -131,23 +144,13 @@ class TestANOVA:
 class TestCorrelation:
     """Tests for Correlation endpoint - /api/statistics/correlation"""
     
-    def test_pearson_correlation(self, api_client):
-        """Test Pearson correlation matrix"""
-        response = api_client.post(
-            f"{BASE_URL}/api/statistics/correlation",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "variables": ["satisfaction", "age"],
-                "method": "pearson"
-            }
-        )
-        
-        assert response.status_code == 200, f"Correlation failed: {response.text}"
-        data = response.json()
+    @pytest.mark.parametrize("method", ["pearson", "spearman", "kendall"])
+    def test_correlation_methods(self, correlation_response, method):
+        """Test correlation matrix for each supported method"""
+        data = correlation_response(method)
         
         # Verify structure
-        assert data["method"] == "pearson"
+        assert data["method"] == method
         assert "n" in data
         assert "variables" in data
         assert len(data["variables"]) >= 2
@@ -169,48 +172,14 @@ class TestCorrelation:
             assert "p_value" in pair
             assert "significant" in pair
     
-    def test_spearman_correlation(self, api_client):
-        """Test Spearman correlation"""
-        response = api_client.post(
-            f"{BASE_URL}/api/statistics/correlation",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "variables": ["satisfaction", "age"],
-                "method": "spearman"
-            }
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["method"] == "spearman"
-    
-    def test_kendall_correlation(self, api_client):
-        """Test Kendall tau correlation"""
-        response = api_client.post(
-            f"{BASE_URL}/api/statistics/correlation",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "variables": ["satisfaction", "age"],
-                "method": "kendall"
-            }
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["method"] == "kendall"
-    
     def test_correlation_requires_two_variables(self, api_client):
         """Test that correlation requires at least 2 variables"""
         response = api_client.post(
-            f"{BASE_URL}/api/statistics/correlation",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "variables": ["satisfaction"],
-                "method": "pearson"
-            }
+            CORRELATION_URL,
+            content=_body(
+                variables=["satisfaction"],
+                method="pearson"
+            )
         )
         
         assert response.status_code == 400, "Should require at least 2 variables"
@@ -221,18 +190,17 @@ class TestCorrelation:
 class TestRegression:
     """Tests for Regression endpoint - /api/statistics/regression"""
     
+    @pytest.mark.slow
     def test_ols_regression(self, api_client):
         """Test OLS regression with R-squared and coefficients"""
         response = api_client.post(
-            f"{BASE_URL}/api/statistics/regression",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "dependent_var": "satisfaction",
-                "independent_vars": ["age"],
-                "model_type": "ols",
-                "robust_se": False
-            }
+            REGRESSION_URL,
+            content=_body(
+                dependent_var="satisfaction",
+                independent_vars=["age"],
+                model_type="ols",
+                robust_se=False
+            )
         )
         
         assert response.status_code == 200, f"Regression failed: {response.text}"
@@ -270,15 +238,13 @@ class TestRegression:
     def test_ols_regression_robust_se(self, api_client):
         """Test OLS with robust standard errors"""
         response = api_client.post(
-            f"{BASE_URL}/api/statistics/regression",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "dependent_var": "satisfaction",
-                "independent_vars": ["age"],
-                "model_type": "ols",
-                "robust_se": True
-            }
+            REGRESSION_URL,
+            content=_body(
+                dependent_var="satisfaction",
+                independent_vars=["age"],
+                model_type="ols",
+                robust_se=True
+            )
         )
         
         assert response.status_code == 200
@@ -288,16 +254,13 @@ class TestRegression:
     def test_regression_missing_dependent(self, api_client):
         """Test regression with missing dependent variable"""
         response = api_client.post(
-            f"{BASE_URL}/api/statistics/regression",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "dependent_var": "nonexistent_var",
-                "independent_vars": ["age"],
-                "model_type": "ols"
-            }
+            REGRESSION_URL,
+            content=_body(
+                dependent_var="nonexistent_var",
+                independent_vars=["age"],
+                model_type="ols"
+            )
         )
-        
         assert response.status_code == 400, "Should reject missing variable"
 
 
@@ -309,14 +272,12 @@ class TestTTest:
     def test_one_sample_ttest(self, api_client):
         """Test one-sample t-test"""
         response = api_client.post(
-            f"{BASE_URL}/api/statistics/ttest",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "test_type": "one_sample",
-                "variable": "satisfaction",
-                "mu": 5
-            }
+            TTEST_URL,
+            content=_body(
+                test_type="one_sample",
+                variable="satisfaction",
+                mu=5
+            )
         )
         
         assert response.status_code == 200, f"T-test failed: {response.text}"
@@ -340,14 +301,12 @@ class TestTTest:
         """Test that independent t-test requires exactly 2 groups"""
         # Gender has 3 groups (male, female, other), should fail
         response = api_client.post(
-            f"{BASE_URL}/api/statistics/ttest",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "test_type": "independent",
-                "variable": "satisfaction",
-                "group_var": "gender"
-            }
+            TTEST_URL,
+            content=_body(
+                test_type="independent",
+                variable="satisfaction",
+                group_var="gender"
+            )
         )
         
         assert response.status_code == 400, "Should reject when not exactly 2 groups"
@@ -357,15 +316,12 @@ class TestTTest:
     def test_independent_ttest_missing_group_var(self, api_client):
         """Test independent t-test without group variable"""
         response = api_client.post(
-            f"{BASE_URL}/api/statistics/ttest",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "test_type": "independent",
-                "variable": "satisfaction"
-            }
+            TTEST_URL,
+            content=_body(
+                test_type="independent",
+                variable="satisfaction"
+            )
         )
-        
         assert response.status_code == 400, "Should require group variable"
 
 
@@ -374,17 +330,16 @@ class TestTTest:
 class TestDescriptives:
     """Tests for Descriptives endpoint - /api/statistics/descriptives"""
     
+    @pytest.mark.slow
     def test_descriptives_with_normality(self, api_client):
         """Test descriptive statistics with normality tests"""
         response = api_client.post(
-            f"{BASE_URL}/api/statistics/descriptives",
-            json={
-                "form_id": FORM_ID,
-                "org_id": ORG_ID,
-                "variables": ["satisfaction", "age"],
-                "include_normality": True,
-                "percentiles": [25, 50, 75]
-            }
+            DESCRIPTIVES_URL,
+            content=_body(
+                variables=["satisfaction", "age"],
+                include_normality=True,
+                percentiles=[25, 50, 75]
+            )
         )
         
         assert response.status_code == 200, f"Descriptives failed: {response.text}"
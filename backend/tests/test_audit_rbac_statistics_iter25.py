@@ -8,50 +8,80 @@ Features tested:
 - Clustering: POST /api/statistics/clustering (kmeans, hierarchical)
 """
 
+import logging
+import orjson
 import pytest
-import requests
-import os
-import time
-
-BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
 # Test credentials
 TEST_EMAIL = "demo@datapulse.io"
-TEST_PASSWORD = "Test123!"
 TEST_ORG_ID = "a07e901a-bd5f-450d-8533-ed4f7ec629a5"
 
+# Paths are relative to the http fixture's base_url
+AUDIT_LOG_URL = "/api/audit/log"
+AUDIT_LOGS_URL = "/api/audit/logs"
+AUDIT_SUMMARY_URL = f"/api/audit/summary/{TEST_ORG_ID}?days=30"
+CHECK_PERMISSION_URL = "/api/rbac/check-permission"
+USER_ROLE_URL = f"/api/rbac/user-role/{TEST_ORG_ID}/test_user_iter25"
+NONPARAMETRIC_URL = "/api/statistics/nonparametric"
+PROPORTIONS_URL = "/api/statistics/proportions"
+CLUSTERING_URL = "/api/statistics/clustering"
+
+logger = logging.getLogger(__name__)
+
+
+def _ok(response, expected=200):
+    """Assert the status and parse the body once; the text is only read on failure"""
+    assert response.status_code == expected, f"Expected {expected}, got {response.status_code}: {response.text}"
+    return orjson.loads(response.content)
+
+
+def _json_body(response):
+    """Parse a JSON body once so failure messages can reuse it instead of .text"""
+    if response.headers.get("content-type", "").startswith("application/json"):
+        return orjson.loads(response.content)
+    return None
+
 
 @pytest.fixture(scope="module")
-def auth_token():
-    """Get authentication token for tests"""
-    response = requests.post(f"{BASE_URL}/api/auth/login", json={
-        "email": TEST_EMAIL,
-        "password": TEST_PASSWORD
-    })
-    if response.status_code == 200:
-        data = response.json()
-        return data.get("token") or data.get("access_token")
-    pytest.skip(f"Authentication failed: {response.status_code} - {response.text}")
+def audit_log(http):
+    """Create one export audit entry for the module to read back"""
+    response = http.post(
+        AUDIT_LOG_URL,
+        json={
+            "org_id": TEST_ORG_ID,
+            "user_id": "test_user_iter25",
+            "user_email": TEST_EMAIL,
+            "action": "export_csv",
+            "resource_type": "form",
+            "resource_id": "test_form_id",
+            "resource_name": "TEST_Audit_Form_Iter25",
+            "details": {"format": "csv", "record_count": 100}
+        }
+    )
+    return _ok(response)
 
 
 @pytest.fixture(scope="module")
-def auth_headers(auth_token):
-    """Return auth headers"""
-    return {"Authorization": f"Bearer {auth_token}", "Content-Type": "application/json"}
+def audit_logs_page1(http, audit_log):
+    """First page of the organization's audit logs, fetched once"""
+    response = http.post(
+        AUDIT_LOGS_URL,
+        json={
+            "org_id": TEST_ORG_ID,
+            "page": 1,
+            "page_size": 20
+        }
+    )
+    return _ok(response)
 
 
 class TestAuditTrail:
     """Test Audit Trail endpoints"""
 
-    def test_audit_summary(self, auth_headers):
+    def test_audit_summary(self, http):
         """Test GET /api/audit/summary/{org_id} returns activity summary"""
-        response = requests.get(
-            f"{BASE_URL}/api/audit/summary/{TEST_ORG_ID}?days=30",
-            headers=auth_headers
-        )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
-        
-        data = response.json()
+        response = http.get(AUDIT_SUMMARY_URL)
+        data = _ok(response)
         # Validate response structure
         assert "period_days" in data, "Missing period_days in response"
         assert "total_actions" in data, "Missing total_actions in response"
@@ -62,22 +92,11 @@ class TestAuditTrail:
         assert "by_resource" in data, "Missing by_resource in response"
         
         assert data["period_days"] == 30
-        print(f"Audit Summary: {data['total_actions']} actions, {data['export_count']} exports in last 30 days")
+        logger.debug("Audit Summary: %s actions, %s exports in last 30 days", data['total_actions'], data['export_count'])
 
-    def test_audit_logs_paginated(self, auth_headers):
+    def test_audit_logs_paginated(self, audit_logs_page1):
         """Test POST /api/audit/logs returns paginated logs"""
-        response = requests.post(
-            f"{BASE_URL}/api/audit/logs",
-            headers=auth_headers,
-            json={
-                "org_id": TEST_ORG_ID,
-                "page": 1,
-                "page_size": 20
-            }
-        )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
-        
-        data = response.json()
+        data = audit_logs_page1
         # Validate pagination structure
         assert "total" in data, "Missing total in response"
         assert "page" in data, "Missing page in response"
@@ -88,13 +107,13 @@ class TestAuditTrail:
         assert data["page"] == 1
         assert data["page_size"] == 20
         assert isinstance(data["logs"], list)
-        print(f"Audit Logs: {data['total']} total logs, page 1 of {data['total_pages']}")
+        assert data["total"] >= 1, "Entry created by audit_log fixture should be counted"
+        logger.debug("Audit Logs: %s total logs, page 1 of %s", data['total'], data['total_pages'])
 
-    def test_audit_logs_with_filters(self, auth_headers):
+    def test_audit_logs_with_filters(self, http):
         """Test POST /api/audit/logs with action filter"""
-        response = requests.post(
-            f"{BASE_URL}/api/audit/logs",
-            headers=auth_headers,
+        response = http.post(
+            AUDIT_LOGS_URL,
             json={
                 "org_id": TEST_ORG_ID,
                 "action": "export_csv",
@@ -102,51 +121,27 @@ class TestAuditTrail:
                 "page_size": 10
             }
         )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
-        
-        data = response.json()
+        data = _ok(response)
         assert "logs" in data
         # If there are logs, they should all be export_csv type
         for log in data["logs"]:
             assert log.get("action") == "export_csv", f"Expected export_csv action, got {log.get('action')}"
-        print(f"Filtered Audit Logs: {data['total']} export_csv logs")
+        logger.debug("Filtered Audit Logs: %s export_csv logs", data['total'])
 
-    def test_create_audit_log(self, auth_headers):
+    def test_create_audit_log(self, audit_log):
         """Test POST /api/audit/log creates new audit entry"""
-        response = requests.post(
-            f"{BASE_URL}/api/audit/log",
-            headers=auth_headers,
-            json={
-                "org_id": TEST_ORG_ID,
-                "user_id": "test_user_iter25",
-                "user_email": TEST_EMAIL,
-                "action": "export_csv",
-                "resource_type": "form",
-                "resource_id": "test_form_id",
-                "resource_name": "TEST_Audit_Form_Iter25",
-                "details": {"format": "csv", "record_count": 100}
-            }
-        )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
-        
-        data = response.json()
+        data = audit_log
         assert "id" in data, "Missing id in response"
         assert "created_at" in data, "Missing created_at in response"
-        print(f"Created audit log with ID: {data['id']}")
+        logger.debug("Created audit log with ID: %s", data['id'])
 
 
 class TestRBAC:
     """Test Role-Based Access Control endpoints"""
 
-    def test_get_roles(self, auth_headers):
+    def test_get_roles(self, roles_response):
         """Test GET /api/rbac/roles/{org_id} returns 4 default roles"""
-        response = requests.get(
-            f"{BASE_URL}/api/rbac/roles/{TEST_ORG_ID}",
-            headers=auth_headers
-        )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
-        
-        data = response.json()
+        data = roles_response["raw"]
         assert "roles" in data, "Missing roles in response"
         
         roles = data["roles"]
@@ -154,12 +149,12 @@ class TestRBAC:
         
         # Check for 4 default roles
         default_role_ids = ["viewer", "analyst", "senior_analyst", "admin"]
-        found_roles = [r["id"] for r in roles if r.get("is_default")]
+        found_roles = roles_response["default_ids"]
         
         for role_id in default_role_ids:
             assert role_id in found_roles, f"Missing default role: {role_id}"
         
-        assert len([r for r in roles if r.get("is_default")]) >= 4, "Should have at least 4 default roles"
+        assert len(found_roles) >= 4, "Should have at least 4 default roles"
         
         # Verify role structure
         for role in roles:
@@ -168,17 +163,11 @@ class TestRBAC:
             assert "permissions" in role, "Missing permissions in role"
             assert "is_default" in role, "Missing is_default in role"
         
-        print(f"Found {len(roles)} roles, {len([r for r in roles if r.get('is_default')])} default roles")
+        logger.debug("Found %s roles, %s default roles", len(roles), len(found_roles))
 
-    def test_get_permissions(self, auth_headers):
+    def test_get_permissions(self, rbac_permissions):
         """Test GET /api/rbac/permissions returns all available permissions"""
-        response = requests.get(
-            f"{BASE_URL}/api/rbac/permissions",
-            headers=auth_headers
-        )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
-        
-        data = response.json()
+        data = rbac_permissions
         assert "permissions" in data, "Missing permissions in response"
         assert "categories" in data, "Missing categories in response"
         
@@ -198,106 +187,69 @@ class TestRBAC:
         for exp_perm in expected_perms:
             assert exp_perm in perm_ids, f"Missing expected permission: {exp_perm}"
         
-        print(f"Found {len(permissions)} permissions across {len(data['categories'])} categories")
+        logger.debug("Found %s permissions across %s categories", len(permissions), len(data['categories']))
 
-    def test_check_permission(self, auth_headers):
+    def test_check_permission(self, http):
         """Test POST /api/rbac/check-permission validates user permissions"""
-        response = requests.post(
-            f"{BASE_URL}/api/rbac/check-permission",
-            headers=auth_headers,
+        response = http.post(
+            CHECK_PERMISSION_URL,
             json={
                 "user_id": "test_user_iter25",
                 "org_id": TEST_ORG_ID,
                 "permission": "view_responses"
             }
         )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
-        
-        data = response.json()
+        data = _ok(response)
         assert "user_id" in data, "Missing user_id in response"
         assert "permission" in data, "Missing permission in response"
         assert "allowed" in data, "Missing allowed in response"
         assert "role_id" in data, "Missing role_id in response"
         
-        print(f"Permission check: user={data['user_id']}, permission={data['permission']}, allowed={data['allowed']}, role={data['role_id']}")
+        logger.debug("Permission check: user=%s, permission=%s, allowed=%s, role=%s", data['user_id'], data['permission'], data['allowed'], data['role_id'])
 
-    def test_get_user_role(self, auth_headers):
+    def test_get_user_role(self, http):
         """Test GET /api/rbac/user-role/{org_id}/{user_id} returns user's role"""
-        response = requests.get(
-            f"{BASE_URL}/api/rbac/user-role/{TEST_ORG_ID}/test_user_iter25",
-            headers=auth_headers
-        )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
-        
-        data = response.json()
+        response = http.get(USER_ROLE_URL)
+        data = _ok(response)
         assert "role_id" in data, "Missing role_id in response"
         assert "role_name" in data, "Missing role_name in response"
         
         # Default user should get viewer role
         assert data["role_id"] == "viewer", f"Expected viewer role, got {data['role_id']}"
-        print(f"User role: {data['role_name']} ({data['role_id']})")
+        logger.debug("User role: %s (%s)", data['role_name'], data['role_id'])
 
 
 class TestNonparametricTests:
     """Test Nonparametric statistical tests"""
 
-    def test_mann_whitney_endpoint(self, auth_headers):
-        """Test POST /api/statistics/nonparametric with mann_whitney test type"""
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/nonparametric",
-            headers=auth_headers,
-            json={
-                "org_id": TEST_ORG_ID,
-                "test_type": "mann_whitney",
-                "dependent_var": "score",
-                "group_var": "group"
-            }
-        )
-        # May return 400 if no data available or 200 with error message
-        assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}: {response.text}"
-        
-        data = response.json()
-        # If successful, check structure
-        if response.status_code == 200 and "error" not in data:
-            assert "test_type" in data
-            assert data["test_type"] == "mann_whitney"
-        print(f"Mann-Whitney test response: {response.status_code}")
-
-    def test_wilcoxon_endpoint(self, auth_headers):
-        """Test POST /api/statistics/nonparametric with wilcoxon test type"""
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/nonparametric",
-            headers=auth_headers,
-            json={
-                "org_id": TEST_ORG_ID,
-                "test_type": "wilcoxon",
-                "dependent_var": "score1",
-                "paired_var": "score2"
-            }
-        )
-        assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}: {response.text}"
-        print(f"Wilcoxon test response: {response.status_code}")
-
-    def test_kruskal_wallis_endpoint(self, auth_headers):
-        """Test POST /api/statistics/nonparametric with kruskal_wallis test type"""
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/nonparametric",
-            headers=auth_headers,
-            json={
-                "org_id": TEST_ORG_ID,
-                "test_type": "kruskal_wallis",
-                "dependent_var": "score",
-                "group_var": "category"
-            }
-        )
-        assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}: {response.text}"
-        print(f"Kruskal-Wallis test response: {response.status_code}")
-
-    def test_invalid_test_type(self, auth_headers):
+    @pytest.mark.requires_data
+    def test_nonparametric_variants(self, post_concurrently):
+        """Test POST /api/statistics/nonparametric for mann_whitney, wilcoxon and kruskal_wallis"""
+        payloads = {
+            "mann_whitney": {"dependent_var": "score", "group_var": "group"},
+            "wilcoxon": {"dependent_var": "score1", "paired_var": "score2"},
+            "kruskal_wallis": {"dependent_var": "score", "group_var": "category"},
+        }
+        # The three variants are independent, so send them together
+        responses = post_concurrently([
+            (NONPARAMETRIC_URL, {"org_id": TEST_ORG_ID, "test_type": test_type, **fields})
+            for test_type, fields in payloads.items()
+        ])
+        
+        for test_type, response in zip(payloads, responses):
+            # May return 400 if no data available or 200 with error message
+            data = _json_body(response)
+            assert response.status_code in [200, 400], f"{test_type}: unexpected status {response.status_code}: {data}"
+            assert data is not None, f"{test_type}: non-JSON {response.status_code} response"
+            # If successful, check structure
+            if response.status_code == 200 and "error" not in data:
+                assert data.get("test_type") == test_type
+            logger.debug("%s test response: %s", test_type, response.status_code)
+
+    def test_invalid_test_type(self, http):
         """Test nonparametric endpoint rejects invalid test type"""
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/nonparametric",
-            headers=auth_headers,
+        response = http.post(
+            NONPARAMETRIC_URL,
             json={
                 "org_id": TEST_ORG_ID,
                 "test_type": "invalid_test",
@@ -306,7 +258,7 @@ class TestNonparametricTests:
         )
         assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}"
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             # Should have error or unknown test type message
             assert "error" in data or "Unknown test type" in str(data), "Should report error for invalid test type"
 
@@ -314,63 +266,33 @@ class TestNonparametricTests:
 class TestProportionsTests:
     """Test Proportions statistical tests"""
 
-    def test_one_sample_proportion(self, auth_headers):
-        """Test POST /api/statistics/proportions with one_sample test"""
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/proportions",
-            headers=auth_headers,
-            json={
-                "org_id": TEST_ORG_ID,
-                "test_type": "one_sample",
-                "variable": "response",
-                "success_value": "yes",
-                "hypothesized_prop": 0.5
-            }
+    @pytest.mark.parametrize("fields", [
+        pytest.param({"test_type": "one_sample", "variable": "response",
+                      "success_value": "yes", "hypothesized_prop": 0.5}, id="one_sample"),
+        pytest.param({"test_type": "two_sample", "variable": "outcome",
+                      "success_value": "success", "group_var": "treatment"}, id="two_sample"),
+        pytest.param({"test_type": "chi_square", "variable": "category1",
+                      "group_var": "category2"}, id="chi_square"),
+    ])
+    @pytest.mark.requires_data
+    def test_proportion(self, http, fields):
+        """Test POST /api/statistics/proportions for each test type"""
+        response = http.post(
+            PROPORTIONS_URL,
+            json={"org_id": TEST_ORG_ID, **fields}
         )
-        assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}: {response.text}"
-        
-        data = response.json()
+        data = _json_body(response)
+        assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}: {data}"
+        assert data is not None, f"Non-JSON {response.status_code} response"
         if response.status_code == 200 and "error" not in data:
-            assert data.get("test_type") == "one_sample"
-        print(f"One-sample proportion test response: {response.status_code}")
-
-    def test_two_sample_proportion(self, auth_headers):
-        """Test POST /api/statistics/proportions with two_sample test"""
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/proportions",
-            headers=auth_headers,
-            json={
-                "org_id": TEST_ORG_ID,
-                "test_type": "two_sample",
-                "variable": "outcome",
-                "success_value": "success",
-                "group_var": "treatment"
-            }
-        )
-        assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}: {response.text}"
-        print(f"Two-sample proportion test response: {response.status_code}")
-
-    def test_chi_square_test(self, auth_headers):
-        """Test POST /api/statistics/proportions with chi_square test"""
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/proportions",
-            headers=auth_headers,
-            json={
-                "org_id": TEST_ORG_ID,
-                "test_type": "chi_square",
-                "variable": "category1",
-                "group_var": "category2"
-            }
-        )
-        assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}: {response.text}"
-        print(f"Chi-square test response: {response.status_code}")
+            assert data.get("test_type") == fields["test_type"]
+        logger.debug("%s proportion test response: %s", fields['test_type'], response.status_code)
 
-    def test_missing_params_validation(self, auth_headers):
+    def test_missing_params_validation(self, http):
         """Test proportions endpoint validates required parameters"""
         # One-sample without hypothesized_prop - should return 400 or error in response
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/proportions",
-            headers=auth_headers,
+        response = http.post(
+            PROPORTIONS_URL,
             json={
                 "org_id": TEST_ORG_ID,
                 "test_type": "one_sample",
@@ -381,84 +303,45 @@ class TestProportionsTests:
         )
         # API may return 200 with error or 400 - either is acceptable for missing data scenarios
         assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}"
-        data = response.json()
+        data = orjson.loads(response.content)
         # Should have some error indication
         if response.status_code == 200:
             assert "error" in data or "detail" in str(data).lower(), "Should indicate an error for incomplete params or missing data"
-        print(f"Missing params validation: status={response.status_code}, response={data}")
+        logger.debug("Missing params validation: status=%s, response=%s", response.status_code, data)
 
 
 class TestClustering:
     """Test Clustering endpoints"""
 
-    def test_kmeans_clustering(self, auth_headers):
-        """Test POST /api/statistics/clustering with kmeans method"""
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/clustering",
-            headers=auth_headers,
-            json={
-                "org_id": TEST_ORG_ID,
-                "variables": ["var1", "var2"],
-                "method": "kmeans",
-                "n_clusters": 3
-            }
+    @pytest.mark.parametrize("fields", [
+        pytest.param({"method": "kmeans", "n_clusters": 3}, id="kmeans"),
+        pytest.param({"method": "hierarchical", "n_clusters": 3, "linkage": "ward"}, id="hierarchical"),
+        # No n_clusters - should use elbow method
+        pytest.param({"method": "kmeans"}, id="kmeans_auto_clusters"),
+    ])
+    @pytest.mark.requires_data
+    def test_clustering(self, http, fields):
+        """Test POST /api/statistics/clustering for each method"""
+        response = http.post(
+            CLUSTERING_URL,
+            json={"org_id": TEST_ORG_ID, "variables": ["var1", "var2"], **fields}
         )
-        assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}: {response.text}"
-        
-        data = response.json()
+        data = _json_body(response)
+        assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}: {data}"
+        assert data is not None, f"Non-JSON {response.status_code} response"
         if response.status_code == 200 and "error" not in data:
-            assert data.get("method") == "kmeans"
+            assert data.get("method") == fields["method"]
             assert "n_clusters" in data
             assert "cluster_profiles" in data or "n_observations" in data
-        print(f"K-means clustering response: {response.status_code}")
-
-    def test_hierarchical_clustering(self, auth_headers):
-        """Test POST /api/statistics/clustering with hierarchical method"""
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/clustering",
-            headers=auth_headers,
-            json={
-                "org_id": TEST_ORG_ID,
-                "variables": ["var1", "var2"],
-                "method": "hierarchical",
-                "n_clusters": 3,
-                "linkage": "ward"
-            }
-        )
-        assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}: {response.text}"
-        
-        data = response.json()
-        if response.status_code == 200 and "error" not in data:
-            assert data.get("method") == "hierarchical"
-        print(f"Hierarchical clustering response: {response.status_code}")
-
-    def test_kmeans_auto_clusters(self, auth_headers):
-        """Test POST /api/statistics/clustering with auto-detect clusters (elbow method)"""
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/clustering",
-            headers=auth_headers,
-            json={
-                "org_id": TEST_ORG_ID,
-                "variables": ["var1", "var2"],
-                "method": "kmeans"
-                # No n_clusters - should use elbow method
-            }
-        )
-        assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}: {response.text}"
-        
-        data = response.json()
-        if response.status_code == 200 and "error" not in data:
             # Should have elbow_data when auto-detecting clusters
             if "elbow_data" in data:
                 assert isinstance(data["elbow_data"], list)
-                print(f"Elbow method detected {data.get('n_clusters')} clusters")
-        print(f"K-means auto-clusters response: {response.status_code}")
+        logger.debug("%s clustering response: %s", fields['method'], response.status_code)
 
-    def test_invalid_method(self, auth_headers):
+    def test_invalid_method(self, http):
         """Test clustering endpoint rejects invalid method"""
-        response = requests.post(
-            f"{BASE_URL}/api/statistics/clustering",
-            headers=auth_headers,
+        response = http.post(
+            CLUSTERING_URL,
             json={
                 "org_id": TEST_ORG_ID,
                 "variables": ["var1", "var2"],
@@ -472,20 +355,12 @@ class TestClustering:
 class TestRBACRoleDetails:
     """Additional RBAC tests for role permissions"""
 
-    def test_viewer_role_permissions(self, auth_headers):
+    def test_viewer_role_permissions(self, roles_response):
         """Verify viewer role has limited permissions"""
-        response = requests.get(
-            f"{BASE_URL}/api/rbac/roles/{TEST_ORG_ID}",
-            headers=auth_headers
-        )
-        assert response.status_code == 200
-        
-        data = response.json()
-        viewer_role = next((r for r in data["roles"] if r["id"] == "viewer"), None)
-        assert viewer_role is not None, "Viewer role not found"
+        viewer_perms = roles_response["permissions"].get("viewer")
+        assert viewer_perms is not None, "Viewer role not found"
         
         # Viewer should have view-only permissions
-        viewer_perms = viewer_role["permissions"]
         assert "view_responses" in viewer_perms, "Viewer should have view_responses"
         assert "run_basic_stats" in viewer_perms, "Viewer should have run_basic_stats"
         assert "view_dashboards" in viewer_perms, "Viewer should have view_dashboards"
@@ -493,21 +368,12 @@ class TestRBACRoleDetails:
         # Viewer should NOT have export or admin permissions
         assert "export_csv" not in viewer_perms, "Viewer should NOT have export_csv"
         assert "manage_users" not in viewer_perms, "Viewer should NOT have manage_users"
-        print(f"Viewer role has {len(viewer_perms)} permissions")
+        logger.debug("Viewer role has %s permissions", len(viewer_perms))
 
-    def test_admin_role_has_all_permissions(self, auth_headers):
+    def test_admin_role_has_all_permissions(self, roles_response):
         """Verify admin role has all permissions"""
-        response = requests.get(
-            f"{BASE_URL}/api/rbac/roles/{TEST_ORG_ID}",
-            headers=auth_headers
-        )
-        assert response.status_code == 200
-        
-        data = response.json()
-        admin_role = next((r for r in data["roles"] if r["id"] == "admin"), None)
-        assert admin_role is not None, "Admin role not found"
-        
-        admin_perms = admin_role["permissions"]
+        admin_perms = roles_response["permissions"].get("admin")
+        assert admin_perms is not None, "Admin role not found"
         
         # Admin should have all key permissions
         expected_admin_perms = [
@@ -517,21 +383,12 @@ class TestRBACRoleDetails:
         for perm in expected_admin_perms:
             assert perm in admin_perms, f"Admin missing permission: {perm}"
         
-        print(f"Admin role has {len(admin_perms)} permissions")
+        logger.debug("Admin role has %s permissions", len(admin_perms))
 
-    def test_analyst_role_export_permissions(self, auth_headers):
+    def test_analyst_role_export_permissions(self, roles_response):
         """Verify analyst role has basic export but not statistical exports"""
-        response = requests.get(
-            f"{BASE_URL}/api/rbac/roles/{TEST_ORG_ID}",
-            headers=auth_headers
-        )
-        assert response.status_code == 200
-        
-        data = response.json()
-        analyst_role = next((r for r in data["roles"] if r["id"] == "analyst"), None)
-        assert analyst_role is not None, "Analyst role not found"
-        
-        analyst_perms = analyst_role["permissions"]
+        analyst_perms = roles_response["permissions"].get("analyst")
+        assert analyst_perms is not None, "Analyst role not found"
         
         # Analyst should have CSV and Excel export
         assert "export_csv" in analyst_perms, "Analyst should have export_csv"
@@ -539,7 +396,7 @@ class TestRBACRoleDetails:
         
         # Analyst should NOT have SPSS/Stata export
         assert "export_spss" not in analyst_perms, "Analyst should NOT have export_spss"
-        print(f"Analyst role has {len(analyst_perms)} permissions")
+        logger.debug("Analyst role has %s permissions", len(analyst_perms))
 
 
 if __name__ == "__main__":
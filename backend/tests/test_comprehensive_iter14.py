@@ -4,305 +4,445 @@ Tests all major modules: Auth, Dashboard, Organizations, Projects, Forms,
 CATI, Backcheck, Token Surveys, Quality AI, Preload/Writeback, Datasets,
 Security, RBAC, Analytics, Workflows, Translations, Admin
 """
-import pytest
-import requests
+import base64
+import itertools
 import os
-from datetime import datetime
 import uuid
+from dataclasses import dataclass
+
+import fastjsonschema
+import httpx
+import orjson
+import pytest
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
+# Seconds before any single request in this suite gives up
+REQUEST_TIMEOUT = 10.0
+
+# Classes only share session-scoped fixtures, so each may run on its own worker
+pytestmark = pytest.mark.xdist_per_class
+
+# Endpoint URLs, built once; templated ones take ids via .format()
+ROOT_URL = f"{BASE_URL}/api/"
+LOGIN_URL = f"{BASE_URL}/api/auth/login"
+ME_URL = f"{BASE_URL}/api/auth/me"
+ORGS_URL = f"{BASE_URL}/api/organizations"
+ORG_URL = f"{BASE_URL}/api/organizations/{{}}"
+ORG_MEMBERS_URL = f"{BASE_URL}/api/organizations/{{}}/members"
+PROJECTS_URL = f"{BASE_URL}/api/projects"
+PROJECT_URL = f"{BASE_URL}/api/projects/{{}}"
+FORMS_URL = f"{BASE_URL}/api/forms"
+FORM_URL = f"{BASE_URL}/api/forms/{{}}"
+BATCH_URL = f"{BASE_URL}/api/batch"
+CATI_PROJECTS_URL = f"{BASE_URL}/api/cati/projects"
+CATI_WORKSTATION_URL = f"{BASE_URL}/api/cati/workstation/status"
+BACKCHECK_CONFIGS_URL = f"{BASE_URL}/api/backcheck/configs"
+DISTRIBUTIONS_URL = f"{BASE_URL}/api/surveys/distributions"
+SPEEDING_CONFIGS_URL = f"{BASE_URL}/api/quality-ai/speeding/configs"
+PRELOAD_CONFIGS_URL = f"{BASE_URL}/api/preload/configs"
+DATASETS_URL = f"{BASE_URL}/api/datasets/"
+ANALYTICS_OVERVIEW_URL = f"{BASE_URL}/api/analytics/overview/{{}}"
+LANGUAGES_URL = f"{BASE_URL}/api/translations/languages"
+TRANSLATE_URL = f"{BASE_URL}/api/translations/translate"
+API_KEYS_URL = f"{BASE_URL}/api/security/api-keys/{{}}"
+ADMIN_DASHBOARD_URL = f"{BASE_URL}/api/admin/dashboard"
+ADMIN_ORGS_URL = f"{BASE_URL}/api/admin/organizations"
+PARADATA_SESSIONS_URL = f"{BASE_URL}/api/paradata/sessions"
+CORRECTION_REQUESTS_URL = f"{BASE_URL}/api/revisions/correction-requests"
+
+
+def _requires(*keys):
+    """Compile a validator for a JSON object that must carry the given keys"""
+    return fastjsonschema.compile({"type": "object", "required": list(keys)})
+
+
+# Response shapes, compiled once at import
+DASHBOARD_STATS = _requires("total_projects", "total_forms", "total_submissions")
+SUBMISSION_TRENDS = fastjsonschema.compile({
+    "type": "array",
+    "items": {"type": "object", "required": ["date", "count"]}
+})
+QUALITY_METRICS = _requires("avg_quality_score", "total_count")
+CATI_PROJECT_CREATED = _requires("project_id")
+CONFIG_CREATED = _requires("config_id")
+DISTRIBUTION_CREATED = _requires("distribution_id")
+DATASET_CREATED = _requires("dataset_id")
+PERMISSIONS = _requires("permissions")
+ROLES = _requires("roles")
+TRIGGERS = _requires("triggers")
+ACTIONS = _requires("actions")
+WORKFLOWS = _requires("workflows")
+WORKFLOW_TEMPLATES = _requires("templates")
+LANGUAGES = _requires("languages")
+TRANSLATION = _requires("translated")
+
+# Listings returned as bare arrays; templates take the org id via .format()
+ARRAY_LIST_ENDPOINTS = [
+    pytest.param(ORGS_URL, id="organizations"),
+    pytest.param(f"{PROJECTS_URL}?org_id={{}}", id="projects"),
+    pytest.param(f"{FORMS_URL}?org_id={{}}", id="forms"),
+]
+
+# Org-scoped listings as (url template, validator for the collection)
+LIST_ENDPOINTS = [
+    pytest.param(f"{CATI_PROJECTS_URL}/{{}}", _requires("projects"), id="cati-projects"),
+    pytest.param(f"{BACKCHECK_CONFIGS_URL}/{{}}", _requires("configs"), id="backcheck-configs"),
+    pytest.param(f"{DISTRIBUTIONS_URL}/{{}}", _requires("distributions"), id="distributions"),
+    pytest.param(f"{PRELOAD_CONFIGS_URL}/{{}}", _requires("configs"), id="preload-configs"),
+    pytest.param(f"{DATASETS_URL}{{}}", _requires("datasets"), id="datasets"),
+    pytest.param(API_KEYS_URL, _requires("keys"), id="api-keys"),
+]
+
 # Test credentials
 TEST_EMAIL = "test@datapulse.io"
 TEST_PASSWORD = "password123"
 
+# Opt-in record/replay of read-only checks via pytest-recording. Export
+# DATAPULSE_TEST_VCR=1 and run once with --record-mode=new_episodes to record
+# cassettes, then later runs replay them without touching the network. Replay
+# matches on URL, so pair it with the seeded ids below.
+replayable = pytest.mark.vcr if os.environ.get('DATAPULSE_TEST_VCR') else (lambda test: test)
+
+# Resources already seeded in the test database. When all three are set the
+# suite uses them as-is instead of looking up or creating any at startup.
+SEEDED_ORG_ID = os.environ.get('TEST_ORG_ID')
+SEEDED_PROJECT_ID = os.environ.get('TEST_PROJECT_ID')
+SEEDED_FORM_ID = os.environ.get('TEST_FORM_ID')
+
+# One random prefix per process; names created during the run share it
+RUN_ID = uuid.uuid4().hex[:8]
+_name_counter = itertools.count()
+
+# Everything but the name and project of the forms this suite creates
+FORM_TEMPLATE = {
+    "description": "Test form",
+    "default_language": "en",
+    "languages": ["en"],
+    "fields": [
+        {"id": "q1", "type": "text", "label": "Name", "required": True},
+        {"id": "q2", "type": "number", "label": "Age"}
+    ]
+}
+
+
+def _unique_name(prefix):
+    """Name for a record created by this run, e.g. TEST_Form_1a2b3c4d_3"""
+    return f"{prefix}_{RUN_ID}_{next(_name_counter)}"
+
+
+def _post(client, url, payload):
+    """POST a JSON body encoded with orjson rather than the stdlib json module"""
+    return client.post(url, content=orjson.dumps(payload), headers={"Content-Type": "application/json"})
+
+
+def _form_payload(name, project_id):
+    """Form creation body for a form named name in project_id"""
+    return {"name": name, "project_id": project_id, **FORM_TEMPLATE}
+
+
+def _ok_json(response):
+    """Assert a 200 and return the decoded body; the response text is only read on failure"""
+    assert response.status_code == 200, f"{response.url}: {response.status_code} {response.text[:200]}"
+    return orjson.loads(response.content)
+
+
 class TestAuthentication:
     """Authentication module tests"""
     
-    def test_login_success(self):
+    def test_login_success(self, api_client):
         """Test successful login with valid credentials"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        response = _post(api_client, LOGIN_URL, {
             "email": TEST_EMAIL,
             "password": TEST_PASSWORD
         })
-        assert response.status_code == 200, f"Login failed: {response.text}"
-        data = response.json()
+        data = _ok_json(response)
         assert "access_token" in data, "No access_token in response"
         assert "user" in data, "No user in response"
         assert data["user"]["email"] == TEST_EMAIL
         
-    def test_login_invalid_credentials(self):
+    def test_login_invalid_credentials(self, api_client):
         """Test login with invalid credentials"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        response = _post(api_client, LOGIN_URL, {
             "email": "wrong@example.com",
             "password": "wrongpass"
         })
         assert response.status_code == 401
         
-    def test_get_current_user(self):
+    def test_forged_token_rejected(self, api_client, forged_token):
+        """Test that a token with a bad signature is rejected (no password hashing involved)"""
+        response = api_client.get(ME_URL, headers={
+            "Authorization": f"Bearer {forged_token}"
+        })
+        assert response.status_code == 401
+        
+    def test_get_current_user(self, api_client):
         """Test getting current user info"""
         # First login
-        login_resp = requests.post(f"{BASE_URL}/api/auth/login", json={
+        login_resp = _post(api_client, LOGIN_URL, {
             "email": TEST_EMAIL,
             "password": TEST_PASSWORD
         })
-        token = login_resp.json()["access_token"]
+        token = orjson.loads(login_resp.content)["access_token"]
         
         # Get user info
-        response = requests.get(f"{BASE_URL}/api/auth/me", headers={
+        response = api_client.get(ME_URL, headers={
             "Authorization": f"Bearer {token}"
         })
-        assert response.status_code == 200
-        data = response.json()
+        data = _ok_json(response)
         assert data["email"] == TEST_EMAIL
 
 
-@pytest.fixture(scope="class")
-def auth_token():
-    """Get authentication token for tests"""
-    response = requests.post(f"{BASE_URL}/api/auth/login", json={
-        "email": TEST_EMAIL,
-        "password": TEST_PASSWORD
-    })
-    if response.status_code == 200:
-        return response.json()["access_token"]
-    pytest.skip("Authentication failed - skipping tests")
-
-
-@pytest.fixture(scope="class")
-def auth_headers(auth_token):
-    """Get headers with auth token"""
-    return {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json"
-    }
-
-
-@pytest.fixture(scope="class")
-def test_org_id(auth_headers):
+@pytest.fixture(scope="session")
+def api_client(test_user_headers):
+    """Authenticated HTTP/2 client shared by the whole suite; requests multiplex over one connection"""
+    # Credentials ride on the client, so call sites never pass headers. The
+    # transport retries refused connections while the backend restarts; a hung
+    # backend fails the test after the timeout instead of stalling the run.
+    transport = httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=40),
+        retries=2
+    )
+    with httpx.Client(
+        transport=transport,
+        headers=test_user_headers,
+        timeout=REQUEST_TIMEOUT
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def forged_token():
+    """Well-formed HS256 JWT with a bogus signature, rejected at signature verification"""
+    def segment(data):
+        return base64.urlsafe_b64encode(orjson.dumps(data)).rstrip(b"=").decode()
+    return f"{segment({'alg': 'HS256', 'typ': 'JWT'})}.{segment({'sub': 'forged', 'email': TEST_EMAIL})}.invalid"
+
+
+def _get_or_create_org(api_client):
     """Create or get test organization"""
     # Try to list existing orgs
-    response = requests.get(f"{BASE_URL}/api/organizations", headers=auth_headers)
-    if response.status_code == 200:
-        orgs = response.json()
-        if orgs:
-            return orgs[0]["id"]
+    response = api_client.get(ORGS_URL)
+    orgs = orjson.loads(response.content) if response.status_code == 200 else None
+    if orgs:
+        return orgs[0]["id"]
     
     # Create new org
-    unique_name = f"TEST_Org_{uuid.uuid4().hex[:8]}"
-    response = requests.post(f"{BASE_URL}/api/organizations", json={
+    unique_name = _unique_name("TEST_Org")
+    response = _post(api_client, ORGS_URL, {
         "name": unique_name,
         "description": "Test organization for automated testing"
-    }, headers=auth_headers)
+    })
     
     if response.status_code == 200:
-        return response.json()["id"]
+        return orjson.loads(response.content)["id"]
     pytest.skip("Could not create test organization")
 
 
-@pytest.fixture(scope="class")
-def test_project_id(auth_headers, test_org_id):
+def _get_or_create_project(api_client, org_id):
     """Create or get test project"""
     # Try to list existing projects
-    response = requests.get(f"{BASE_URL}/api/projects?org_id={test_org_id}", headers=auth_headers)
-    if response.status_code == 200:
-        projects = response.json()
-        if projects:
-            return projects[0]["id"]
+    response = api_client.get(PROJECTS_URL, params={"org_id": org_id})
+    projects = orjson.loads(response.content) if response.status_code == 200 else None
+    if projects:
+        return projects[0]["id"]
     
     # Create new project
-    unique_name = f"TEST_Project_{uuid.uuid4().hex[:8]}"
-    response = requests.post(f"{BASE_URL}/api/projects", json={
+    unique_name = _unique_name("TEST_Project")
+    response = _post(api_client, PROJECTS_URL, {
         "name": unique_name,
-        "org_id": test_org_id,
+        "org_id": org_id,
         "description": "Test project for automated testing"
-    }, headers=auth_headers)
+    })
     
     if response.status_code == 200:
-        return response.json()["id"]
+        return orjson.loads(response.content)["id"]
     pytest.skip("Could not create test project")
 
 
-@pytest.fixture(scope="class")
-def test_form_id(auth_headers, test_project_id):
-    """Create or get test form"""
-    # Create a new form
-    unique_name = f"TEST_Form_{uuid.uuid4().hex[:8]}"
-    response = requests.post(f"{BASE_URL}/api/forms", json={
-        "name": unique_name,
-        "project_id": test_project_id,
-        "description": "Test form",
-        "default_language": "en",
-        "languages": ["en"],
-        "fields": [
-            {"id": "q1", "type": "text", "label": "Name", "required": True},
-            {"id": "q2", "type": "number", "label": "Age"}
-        ]
-    }, headers=auth_headers)
+def _create_form(api_client, project_id):
+    """Create a test form"""
+    unique_name = _unique_name("TEST_Form")
+    response = _post(api_client, FORMS_URL, _form_payload(unique_name, project_id))
     
     if response.status_code == 200:
-        return response.json()["id"]
+        return orjson.loads(response.content)["id"]
     pytest.skip("Could not create test form")
 
 
+@pytest.fixture(scope="session")
+def get_concurrently(test_user_request_concurrently):
+    """Send independent read-only GETs for the test user in one round of latency"""
+    def get(urls):
+        return test_user_request_concurrently("GET", [(url, None) for url in urls])
+    return get
+
+
+@dataclass(frozen=True)
+class SuiteResources:
+    """Organization, project and form every resource-bound test works against"""
+    org_id: str
+    project_id: str
+    form_id: str
+
+
+@pytest.fixture(scope="session")
+def resources(api_client, worker_shared):
+    """Resolve the org, project and form once and share them with every test"""
+    if SEEDED_ORG_ID and SEEDED_PROJECT_ID and SEEDED_FORM_ID:
+        return SuiteResources(org_id=SEEDED_ORG_ID, project_id=SEEDED_PROJECT_ID, form_id=SEEDED_FORM_ID)
+
+    def create():
+        org_id = _get_or_create_org(api_client)
+        project_id = _get_or_create_project(api_client, org_id)
+        form_id = _create_form(api_client, project_id)
+        return {"org_id": org_id, "project_id": project_id, "form_id": form_id}
+
+    # Resolved by whichever xdist worker gets there first and reused by the rest
+    ids = worker_shared(f"{BASE_URL}|{TEST_EMAIL}|resources", create)
+    return SuiteResources(**ids)
+
+
 class TestHealthCheck:
-    """Health check endpoints"""
+    """API root endpoint; /api/health is probed once per run by conftest"""
     
-    def test_api_root(self):
-        """Test API root endpoint"""
-        response = requests.get(f"{BASE_URL}/api/")
-        assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        
-    def test_health_endpoint(self):
-        """Test health check endpoint"""
-        response = requests.get(f"{BASE_URL}/api/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert data["database"] == "connected"
+    def test_api_root(self, api_client):
+        """Test API root endpoint serves its pre-encoded JSON body"""
+        response = api_client.get(ROOT_URL)
+        data = _ok_json(response)
+        assert response.headers["Content-Type"].startswith("application/json")
+        assert data["message"] == "DataPulse API is running"
+        assert "version" in data
 
 
 class TestOrganizations:
     """Organization management tests"""
     
-    def test_list_organizations(self, auth_headers):
-        """Test listing organizations"""
-        response = requests.get(f"{BASE_URL}/api/organizations", headers=auth_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-        
-    def test_get_organization(self, auth_headers, test_org_id):
+    def test_get_organization(self, api_client, resources):
         """Test getting single organization"""
-        response = requests.get(f"{BASE_URL}/api/organizations/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == test_org_id
+        response = api_client.get(ORG_URL.format(resources.org_id))
+        data = _ok_json(response)
+        assert data["id"] == resources.org_id
         
-    def test_get_org_members(self, auth_headers, test_org_id):
+    def test_get_org_members(self, api_client, resources):
         """Test getting organization members"""
-        response = requests.get(f"{BASE_URL}/api/organizations/{test_org_id}/members", headers=auth_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
+        response = api_client.get(ORG_MEMBERS_URL.format(resources.org_id))
+        assert isinstance(_ok_json(response), list)
 
 
 class TestProjects:
     """Project management tests"""
     
-    def test_list_projects(self, auth_headers, test_org_id):
-        """Test listing projects"""
-        response = requests.get(f"{BASE_URL}/api/projects?org_id={test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-        
-    def test_create_project(self, auth_headers, test_org_id):
-        """Test creating project"""
-        unique_name = f"TEST_Project_{uuid.uuid4().hex[:8]}"
-        response = requests.post(f"{BASE_URL}/api/projects", json={
+    @pytest.mark.slow
+    def test_project_crud(self, api_client, resources):
+        """Test creating a project, then reading it back singly and in the org listing"""
+        unique_name = _unique_name("TEST_Project")
+        response = _post(api_client, PROJECTS_URL, {
             "name": unique_name,
-            "org_id": test_org_id,
+            "org_id": resources.org_id,
             "description": "Test project"
-        }, headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
+        })
+        data = _ok_json(response)
         assert data["name"] == unique_name
-        assert "id" in data
+        project_id = data["id"]
         
-    def test_get_project(self, auth_headers, test_project_id):
-        """Test getting single project"""
-        response = requests.get(f"{BASE_URL}/api/projects/{test_project_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == test_project_id
+        response = api_client.get(PROJECT_URL.format(project_id))
+        assert _ok_json(response)["name"] == unique_name
+        
+        response = api_client.get(PROJECTS_URL, params={"org_id": resources.org_id})
+        assert project_id in {project["id"] for project in _ok_json(response)}
 
 
 class TestForms:
     """Form management tests"""
     
-    def test_list_forms(self, auth_headers, test_org_id):
-        """Test listing forms"""
-        response = requests.get(f"{BASE_URL}/api/forms?org_id={test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-        
-    def test_create_form(self, auth_headers, test_project_id):
-        """Test creating form"""
-        unique_name = f"TEST_Form_{uuid.uuid4().hex[:8]}"
-        response = requests.post(f"{BASE_URL}/api/forms", json={
-            "name": unique_name,
-            "project_id": test_project_id,
-            "description": "Test form",
-            "default_language": "en",
-            "languages": ["en"],
-            "fields": [
-                {"id": "q1", "type": "text", "label": "Name", "required": True},
-                {"id": "q2", "type": "number", "label": "Age"}
-            ]
-        }, headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
+    @pytest.mark.slow
+    def test_form_crud(self, api_client, resources):
+        """Test creating a form, then reading it back singly and in the project listing"""
+        unique_name = _unique_name("TEST_Form")
+        response = _post(api_client, FORMS_URL, _form_payload(unique_name, resources.project_id))
+        data = _ok_json(response)
         assert data["name"] == unique_name
-        assert "id" in data
+        form_id = data["id"]
+        
+        response = api_client.get(FORM_URL.format(form_id))
+        assert _ok_json(response)["name"] == unique_name
+        
+        response = api_client.get(FORMS_URL, params={"project_id": resources.project_id})
+        assert form_id in {form["id"] for form in _ok_json(response)}
 
 
 class TestDashboard:
     """Dashboard and analytics tests"""
     
-    def test_get_dashboard_stats(self, auth_headers, test_org_id):
-        """Test getting dashboard statistics"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/stats?org_id={test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "total_projects" in data
-        assert "total_forms" in data
-        assert "total_submissions" in data
+    def test_dashboard_endpoints(self, api_client, resources):
+        """Test dashboard stats, submission trends and quality metrics in one batch call"""
+        paths = [
+            f"/api/dashboard/stats?org_id={resources.org_id}",
+            f"/api/dashboard/submission-trends?org_id={resources.org_id}",
+            f"/api/dashboard/quality-metrics?org_id={resources.org_id}",
+        ]
+        response = _post(api_client, BATCH_URL, {
+            "ops": [{"method": "GET", "path": path} for path in paths]
+        })
+        stats, trends, quality = _ok_json(response)["results"]
         
-    def test_get_submission_trends(self, auth_headers, test_org_id):
-        """Test getting submission trends"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/submission-trends?org_id={test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        if data:
-            assert "date" in data[0]
-            assert "count" in data[0]
-            
-    def test_get_quality_metrics(self, auth_headers, test_org_id):
-        """Test getting quality metrics"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/quality-metrics?org_id={test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "avg_quality_score" in data
-        assert "total_count" in data
+        # Dashboard statistics
+        assert stats["status"] == 200
+        DASHBOARD_STATS(stats["body"])
+        
+        # Submission trends
+        assert trends["status"] == 200
+        SUBMISSION_TRENDS(trends["body"])
+        
+        # Quality metrics
+        assert quality["status"] == 200
+        QUALITY_METRICS(quality["body"])
+    
+    def test_batch_rejects_writes(self, api_client):
+        """Test that only GET operations can be batched"""
+        response = _post(api_client, BATCH_URL, {
+            "ops": [{"method": "POST", "path": "/api/projects"}]
+        })
+        assert response.status_code == 400
+
+
+@replayable
+class TestListEndpoints:
+    """Org-scoped listings"""
+    
+    @pytest.mark.parametrize("url", ARRAY_LIST_ENDPOINTS)
+    def test_list_returns_array(self, api_client, resources, url):
+        """Test listing a collection that comes back as a bare JSON array"""
+        response = api_client.get(url.format(resources.org_id))
+        assert isinstance(_ok_json(response), list)
+    
+    @pytest.mark.parametrize("url, validate", LIST_ENDPOINTS)
+    def test_list_endpoint(self, api_client, resources, url, validate):
+        """Test listing a collection returned under a key - GET /{org_id}"""
+        response = api_client.get(url.format(resources.org_id))
+        validate(_ok_json(response))
 
 
 class TestCATI:
     """CATI (Computer-Assisted Telephone Interviewing) tests"""
     
-    def test_list_cati_projects(self, auth_headers, test_org_id):
-        """Test listing CATI projects - uses path param /{org_id}"""
-        response = requests.get(f"{BASE_URL}/api/cati/projects/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "projects" in data
-        
-    def test_create_cati_project(self, auth_headers, test_org_id, test_form_id):
+    @pytest.mark.slow
+    def test_create_cati_project(self, api_client, resources):
         """Test creating CATI project"""
-        unique_name = f"TEST_CATI_{uuid.uuid4().hex[:8]}"
-        response = requests.post(f"{BASE_URL}/api/cati/projects", json={
-            "org_id": test_org_id,
+        unique_name = _unique_name("TEST_CATI")
+        response = _post(api_client, CATI_PROJECTS_URL, {
+            "org_id": resources.org_id,
             "name": unique_name,
-            "form_id": test_form_id,
+            "form_id": resources.form_id,
             "description": "Test CATI project"
-        }, headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "project_id" in data
+        })
+        CATI_PROJECT_CREATED(_ok_json(response))
         
-    def test_get_cati_workstation(self, auth_headers, test_org_id):
+    def test_get_cati_workstation(self, api_client):
         """Test CATI workstation endpoint"""
-        response = requests.get(f"{BASE_URL}/api/cati/workstation/status", headers=auth_headers)
+        response = api_client.get(CATI_WORKSTATION_URL)
         # May return empty data but should be valid endpoint
         assert response.status_code in [200, 404]
 
@@ -310,133 +450,94 @@ class TestCATI:
 class TestBackcheck:
     """Back-check module tests"""
     
-    def test_list_backcheck_configs(self, auth_headers, test_org_id):
-        """Test listing back-check configurations - uses path param /{org_id}"""
-        response = requests.get(f"{BASE_URL}/api/backcheck/configs/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "configs" in data
-        
-    def test_create_backcheck_config(self, auth_headers, test_org_id, test_project_id, test_form_id):
+    @pytest.mark.slow
+    def test_create_backcheck_config(self, api_client, resources):
         """Test creating back-check configuration"""
-        unique_name = f"TEST_Backcheck_{uuid.uuid4().hex[:8]}"
-        response = requests.post(f"{BASE_URL}/api/backcheck/configs", json={
-            "org_id": test_org_id,
-            "project_id": test_project_id,
-            "form_id": test_form_id,
+        unique_name = _unique_name("TEST_Backcheck")
+        response = _post(api_client, BACKCHECK_CONFIGS_URL, {
+            "org_id": resources.org_id,
+            "project_id": resources.project_id,
+            "form_id": resources.form_id,
             "name": unique_name,
             "sample_percentage": 10,
             "sampling_method": "random",
             "verification_fields": ["q1", "q2"],
             "key_fields": ["q1"]
-        }, headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "config_id" in data
+        })
+        CONFIG_CREATED(_ok_json(response))
 
 
 class TestTokenSurveys:
     """Token/Panel survey distribution tests"""
     
-    def test_list_distributions(self, auth_headers, test_org_id):
-        """Test listing survey distributions - uses path param /{org_id}"""
-        response = requests.get(f"{BASE_URL}/api/surveys/distributions/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "distributions" in data
-        
-    def test_create_distribution(self, auth_headers, test_org_id, test_form_id):
+    @pytest.mark.slow
+    def test_create_distribution(self, api_client, resources):
         """Test creating survey distribution"""
-        unique_name = f"TEST_Dist_{uuid.uuid4().hex[:8]}"
-        response = requests.post(f"{BASE_URL}/api/surveys/distributions", json={
-            "org_id": test_org_id,
+        unique_name = _unique_name("TEST_Dist")
+        response = _post(api_client, DISTRIBUTIONS_URL, {
+            "org_id": resources.org_id,
             "name": unique_name,
-            "form_id": test_form_id,
+            "form_id": resources.form_id,
             "mode": "token",
             "allow_multiple_submissions": False
-        }, headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "distribution_id" in data
+        })
+        DISTRIBUTION_CREATED(_ok_json(response))
 
 
 class TestQualityAI:
     """Quality AI monitoring tests"""
     
-    def test_get_speeding_configs(self, auth_headers, test_org_id):
-        """Test listing speeding configs"""
-        response = requests.get(f"{BASE_URL}/api/quality-ai/speeding/configs/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
+    def test_read_endpoints(self, get_concurrently, resources):
+        """Test speeding configs, audio audit configs, alerts and alert summary"""
+        responses = get_concurrently([
+            f"/api/quality-ai/speeding/configs/{resources.org_id}",
+            f"/api/quality-ai/audio-audit/configs/{resources.org_id}",
+            f"/api/quality-ai/alerts/{resources.org_id}",
+            f"/api/quality-ai/alerts/{resources.org_id}/summary",
+        ])
+        for response in responses:
+            assert response.status_code == 200, f"{response.url}: {response.status_code}"
         
-    def test_create_speeding_config(self, auth_headers, test_org_id, test_form_id):
+    @pytest.mark.slow
+    def test_create_speeding_config(self, api_client, resources):
         """Test creating speeding detection config"""
-        response = requests.post(f"{BASE_URL}/api/quality-ai/speeding/configs", json={
-            "org_id": test_org_id,
-            "form_id": test_form_id,
+        response = _post(api_client, SPEEDING_CONFIGS_URL, {
+            "org_id": resources.org_id,
+            "form_id": resources.form_id,
             "min_expected_time": 60,
             "warning_threshold": 0.7,
             "critical_threshold": 0.5
-        }, headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
+        })
+        data = _ok_json(response)
         assert "id" in data
-        
-    def test_get_audio_audit_configs(self, auth_headers, test_org_id):
-        """Test listing audio audit configs"""
-        response = requests.get(f"{BASE_URL}/api/quality-ai/audio-audit/configs/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        
-    def test_get_quality_alerts(self, auth_headers, test_org_id):
-        """Test getting quality alerts"""
-        response = requests.get(f"{BASE_URL}/api/quality-ai/alerts/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        
-    def test_get_alert_summary(self, auth_headers, test_org_id):
-        """Test getting alert summary"""
-        response = requests.get(f"{BASE_URL}/api/quality-ai/alerts/{test_org_id}/summary", headers=auth_headers)
-        assert response.status_code == 200
 
 
 class TestPreloadWriteback:
     """Preload/Writeback configuration tests"""
     
-    def test_list_preload_configs(self, auth_headers, test_org_id):
-        """Test listing preload configs - uses path param /{org_id}"""
-        response = requests.get(f"{BASE_URL}/api/preload/configs/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "configs" in data
-        
-    def test_create_preload_config(self, auth_headers, test_org_id, test_form_id):
+    @pytest.mark.slow
+    def test_create_preload_config(self, api_client, resources):
         """Test creating preload config"""
-        unique_name = f"TEST_Preload_{uuid.uuid4().hex[:8]}"
-        response = requests.post(f"{BASE_URL}/api/preload/configs", json={
-            "org_id": test_org_id,
-            "form_id": test_form_id,
+        unique_name = _unique_name("TEST_Preload")
+        response = _post(api_client, PRELOAD_CONFIGS_URL, {
+            "org_id": resources.org_id,
+            "form_id": resources.form_id,
             "name": unique_name,
             "sources": [],
             "mappings": []
-        }, headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "config_id" in data
+        })
+        CONFIG_CREATED(_ok_json(response))
 
 
 class TestDatasets:
     """Lookup datasets tests"""
     
-    def test_list_datasets(self, auth_headers, test_org_id):
-        """Test listing datasets - uses path param /{org_id}"""
-        response = requests.get(f"{BASE_URL}/api/datasets/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "datasets" in data
-        
-    def test_create_dataset(self, auth_headers, test_org_id):
+    @pytest.mark.slow
+    def test_create_dataset(self, api_client, resources):
         """Test creating dataset"""
-        unique_name = f"TEST_Dataset_{uuid.uuid4().hex[:8]}"
-        response = requests.post(f"{BASE_URL}/api/datasets/", json={
-            "org_id": test_org_id,
+        unique_name = _unique_name("TEST_Dataset")
+        response = _post(api_client, DATASETS_URL, {
+            "org_id": resources.org_id,
             "name": unique_name,
             "description": "Test dataset",
             "columns": [
@@ -446,151 +547,120 @@ class TestDatasets:
             "searchable_fields": ["id"],
             "display_field": "id",
             "value_field": "id"
-        }, headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "dataset_id" in data
+        })
+        DATASET_CREATED(_ok_json(response))
 
 
 class TestAnalytics:
     """Analytics module tests"""
     
-    def test_get_analytics_overview(self, auth_headers, test_org_id):
+    def test_get_analytics_overview(self, api_client, resources):
         """Test getting analytics overview - uses path param /{org_id}"""
-        response = requests.get(f"{BASE_URL}/api/analytics/overview/{test_org_id}", headers=auth_headers)
+        response = api_client.get(ANALYTICS_OVERVIEW_URL.format(resources.org_id))
         assert response.status_code == 200
 
 
 class TestRBAC:
     """Role-based access control tests"""
     
-    def test_get_permissions(self, auth_headers):
-        """Test getting permissions list"""
-        response = requests.get(f"{BASE_URL}/api/rbac/permissions", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "permissions" in data
+    def test_rbac_endpoints(self, get_concurrently, resources):
+        """Test permissions list, default roles and org roles together"""
+        permissions, defaults, org_roles = get_concurrently([
+            "/api/rbac/permissions",
+            "/api/rbac/roles/defaults",
+            f"/api/rbac/roles/{resources.org_id}",
+        ])
         
-    def test_get_default_roles(self, auth_headers):
-        """Test getting default roles"""
-        response = requests.get(f"{BASE_URL}/api/rbac/roles/defaults", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "roles" in data
+        PERMISSIONS(_ok_json(permissions))
         
-    def test_list_org_roles(self, auth_headers, test_org_id):
-        """Test listing roles for org - uses path param /{org_id}"""
-        response = requests.get(f"{BASE_URL}/api/rbac/roles/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
+        ROLES(_ok_json(defaults))
+        
+        assert org_roles.status_code == 200
 
 
 class TestWorkflows:
     """Workflow automation tests"""
     
-    def test_get_trigger_types(self, auth_headers):
-        """Test getting workflow trigger types"""
-        response = requests.get(f"{BASE_URL}/api/workflows/triggers", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "triggers" in data
+    def test_workflow_endpoints(self, get_concurrently, resources):
+        """Test trigger types, action types, workflows and templates together"""
+        triggers, actions, workflows, templates = get_concurrently([
+            "/api/workflows/triggers",
+            "/api/workflows/actions",
+            f"/api/workflows/{resources.org_id}",
+            f"/api/workflows/{resources.org_id}/templates",
+        ])
         
-    def test_get_action_types(self, auth_headers):
-        """Test getting workflow action types"""
-        response = requests.get(f"{BASE_URL}/api/workflows/actions", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "actions" in data
+        TRIGGERS(_ok_json(triggers))
         
-    def test_list_workflows(self, auth_headers, test_org_id):
-        """Test listing workflows - uses path param /{org_id}"""
-        response = requests.get(f"{BASE_URL}/api/workflows/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "workflows" in data
+        ACTIONS(_ok_json(actions))
         
-    def test_get_workflow_templates(self, auth_headers, test_org_id):
-        """Test getting workflow templates"""
-        response = requests.get(f"{BASE_URL}/api/workflows/{test_org_id}/templates", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "templates" in data
+        WORKFLOWS(_ok_json(workflows))
+        
+        WORKFLOW_TEMPLATES(_ok_json(templates))
 
 
 class TestTranslations:
     """Translation management tests"""
     
-    def test_get_supported_languages(self, auth_headers):
+    @replayable
+    def test_get_supported_languages(self, api_client):
         """Test getting supported languages"""
-        response = requests.get(f"{BASE_URL}/api/translations/languages", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "languages" in data
+        response = api_client.get(LANGUAGES_URL)
+        LANGUAGES(_ok_json(response))
         
-    def test_translate_text(self, auth_headers):
+    def test_translate_text(self, api_client):
         """Test translating text"""
-        response = requests.post(f"{BASE_URL}/api/translations/translate", json={
+        response = _post(api_client, TRANSLATE_URL, {
             "text": "Yes",
             "source_language": "en",
             "target_language": "sw"
-        }, headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "translated" in data
-
-
-class TestSecurity:
-    """Security and API key management tests"""
-    
-    def test_list_api_keys(self, auth_headers, test_org_id):
-        """Test listing API keys - uses path param /{org_id}"""
-        response = requests.get(f"{BASE_URL}/api/security/api-keys/{test_org_id}", headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "keys" in data
+        })
+        TRANSLATION(_ok_json(response))
 
 
 class TestAdmin:
     """Super admin tests (may require superadmin role)"""
     
-    def test_admin_dashboard(self, auth_headers):
+    def test_admin_dashboard(self, api_client):
         """Test admin dashboard endpoint"""
-        response = requests.get(f"{BASE_URL}/api/admin/dashboard", headers=auth_headers)
+        response = api_client.get(ADMIN_DASHBOARD_URL)
         # May return 403 if not superadmin, but endpoint should exist
         assert response.status_code in [200, 403]
         
-    def test_admin_organizations(self, auth_headers):
+    def test_admin_organizations(self, api_client):
         """Test admin orgs listing"""
-        response = requests.get(f"{BASE_URL}/api/admin/organizations", headers=auth_headers)
+        response = api_client.get(ADMIN_ORGS_URL)
         assert response.status_code in [200, 403]
 
 
 class TestParadata:
     """Paradata (field operation metadata) tests"""
     
-    def test_create_paradata_session(self, auth_headers, test_form_id):
+    @pytest.mark.slow
+    def test_create_paradata_session(self, api_client, resources):
         """Test creating paradata session"""
-        response = requests.post(f"{BASE_URL}/api/paradata/sessions", json={
-            "submission_id": f"test_sub_{uuid.uuid4().hex[:8]}",
-            "form_id": test_form_id,
+        response = _post(api_client, PARADATA_SESSIONS_URL, {
+            "submission_id": _unique_name("test_sub"),
+            "form_id": resources.form_id,
             "enumerator_id": "test_enum",
             "device_id": "test_device"
-        }, headers=auth_headers)
-        assert response.status_code == 200
-        data = response.json()
+        })
+        data = _ok_json(response)
         assert "session_id" in data
 
 
 class TestRevisions:
     """Submission revision tests"""
     
-    def test_create_correction_request(self, auth_headers):
+    @pytest.mark.slow
+    def test_create_correction_request(self, api_client):
         """Test creating correction request (will fail if no submission, but endpoint should work)"""
-        response = requests.post(f"{BASE_URL}/api/revisions/correction-requests", json={
+        response = _post(api_client, CORRECTION_REQUESTS_URL, {
             "submission_id": "nonexistent",
             "requested_by": "test_user",
             "fields_to_correct": ["q1"],
             "notes": "Please correct"
-        }, headers=auth_headers)
+        })
         # Will return 404 for nonexistent submission, which is correct behavior
         assert response.status_code in [200, 404]
 
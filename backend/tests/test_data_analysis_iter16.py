@@ -5,91 +5,104 @@ Tests for: Response Browsing, Statistics, Export, Snapshots, AI Copilot
 import pytest
 import requests
 import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+if not BASE_URL:
+    pytest.skip("REACT_APP_BACKEND_URL not set", allow_module_level=True)
 
-# Test credentials from review request
-TEST_USER = "test@datapulse.io"
-TEST_PASSWORD = "password123"
 TEST_ORG_ID = "ad326e2a-f7a4-4b3f-b4d2-0e1ba0fd9fbd"
 TEST_FORM_ID = "124427aa-d482-4292-af6e-2042ae5cabbd"
 
+# Seconds before a request gives up; the AI copilot is the slowest endpoint
+REQUEST_TIMEOUT = 30
+
+BROWSE_URL = f"{BASE_URL}/api/analysis/responses/browse"
+EXPORT_URL = f"{BASE_URL}/api/export/download"
+
+# Export format -> (extra request fields, accepted statuses, expected Content-Type
+# fragment). Every format may 404 when there is no data; SPSS and Stata also
+# 500 when pyreadstat is not installed on the backend.
+EXPORT_FORMATS = {
+    "csv": ({"include_labels": True}, (200, 404), "text/csv"),
+    "xlsx": ({"include_labels": True, "include_codebook": True}, (200, 404), "spreadsheet"),
+    "parquet": ({}, (200, 404), None),
+    "spss": ({}, (200, 404, 500), None),
+    "stata": ({}, (200, 404, 500), None),
+}
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """HTTPAdapter that applies REQUEST_TIMEOUT to requests sent without a timeout"""
+    
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=timeout or REQUEST_TIMEOUT, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def api_session(test_user_token):
+    """Authenticated session reused by every test in the module"""
+    session = requests.Session()
+    # Gateway errors while the backend restarts are retried on the pooled
+    # connection; urllib3 only replays idempotent methods, so creates never repeat
+    adapter = _TimeoutAdapter(
+        pool_connections=4,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Authorization": f"Bearer {test_user_token}"})
+    yield session
+    session.close()
+
 
 class TestDataAnalysisModule:
     """Data Analysis Module Tests - Phase 1"""
     
     @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test session with auth token"""
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
-        
-        # Login to get token
-        login_response = self.session.post(f"{BASE_URL}/api/auth/login", json={
-            "email": TEST_USER,
-            "password": TEST_PASSWORD
-        })
-        assert login_response.status_code == 200, f"Login failed: {login_response.text}"
-        
-        token = login_response.json().get("access_token")
-        assert token, "No token (access_token) in login response"
-        self.session.headers.update({"Authorization": f"Bearer {token}"})
-        
-        yield
-        self.session.close()
+    def setup(self, api_session):
+        """Point each test at the module's logged-in session"""
+        self.session = api_session
     
     # ============ Response Browsing API Tests ============
     
-    def test_browse_responses_success(self):
-        """Test /api/analysis/responses/browse returns paginated responses"""
-        response = self.session.post(f"{BASE_URL}/api/analysis/responses/browse", json={
-            "form_id": TEST_FORM_ID,
-            "page": 1,
-            "page_size": 20
-        })
-        
-        assert response.status_code == 200, f"Browse responses failed: {response.text}"
-        data = response.json()
-        
-        # Verify response structure
+    def test_browse_responses(self, test_user_post_concurrently):
+        """Test /api/analysis/responses/browse for the first page, a status filter and page 2 together"""
+        first_page, approved, second_page = test_user_post_concurrently([
+            (BROWSE_URL, {"form_id": TEST_FORM_ID, "page": 1, "page_size": 20}),
+            (BROWSE_URL, {"form_id": TEST_FORM_ID, "page": 1, "page_size": 10, "status": ["approved"]}),
+            (BROWSE_URL, {"form_id": TEST_FORM_ID, "page": 2, "page_size": 5}),
+        ])
+        
+        # Paginated responses
+        assert first_page.status_code == 200, f"Browse responses failed: {first_page.text}"
+        data = first_page.json()
         assert "total" in data, "Missing 'total' in response"
         assert "page" in data, "Missing 'page' in response"
         assert "responses" in data, "Missing 'responses' in response"
         assert isinstance(data["responses"], list), "responses should be a list"
-        
         # Verify data was returned (test data exists)
         assert data["total"] > 0, f"No responses found for form {TEST_FORM_ID}"
         print(f"SUCCESS: Browse responses returned {data['total']} total, page {data['page']}")
-    
-    def test_browse_responses_with_status_filter(self):
-        """Test browse with status filter"""
-        response = self.session.post(f"{BASE_URL}/api/analysis/responses/browse", json={
-            "form_id": TEST_FORM_ID,
-            "page": 1,
-            "page_size": 10,
-            "status": ["approved"]
-        })
         
-        assert response.status_code == 200, f"Filtered browse failed: {response.text}"
-        data = response.json()
+        # Status filter: all responses should have approved status
+        assert approved.status_code == 200, f"Filtered browse failed: {approved.text}"
+        data = approved.json()
         assert "responses" in data
-        
-        # All responses should have approved status
         for r in data["responses"]:
             assert r.get("status") == "approved" or r.get("status") is None
-        
         print(f"SUCCESS: Filtered browse returned {len(data['responses'])} approved responses")
-    
-    def test_browse_responses_pagination(self):
-        """Test pagination works correctly"""
-        response = self.session.post(f"{BASE_URL}/api/analysis/responses/browse", json={
-            "form_id": TEST_FORM_ID,
-            "page": 2,
-            "page_size": 5
-        })
         
-        assert response.status_code == 200
-        data = response.json()
+        # Pagination
+        assert second_page.status_code == 200
+        data = second_page.json()
         assert data["page"] == 2
         assert "total_pages" in data
         print(f"SUCCESS: Pagination works - Page 2, total pages: {data.get('total_pages')}")
@@ -243,84 +256,23 @@ class TestDataAnalysisModule:
     
     # ============ Export API Tests ============
     
-    def test_export_csv(self):
-        """Test /api/export/download exports data as CSV"""
-        response = self.session.post(f"{BASE_URL}/api/export/download", json={
-            "form_id": TEST_FORM_ID,
-            "org_id": TEST_ORG_ID,
-            "format": "csv",
-            "include_labels": True
-        })
-        
-        # May return 200 with file or 404 if no data
-        assert response.status_code in [200, 404], f"Export CSV unexpected status: {response.status_code}"
-        
-        if response.status_code == 200:
-            # Should return CSV content
-            content_type = response.headers.get("Content-Type", "")
-            assert "text/csv" in content_type or "application/octet-stream" in content_type or len(response.content) > 0
-            print(f"SUCCESS: CSV export returned {len(response.content)} bytes")
-        else:
-            print("INFO: No data to export (404)")
-    
-    def test_export_excel(self):
-        """Test /api/export/download exports data as Excel"""
-        response = self.session.post(f"{BASE_URL}/api/export/download", json={
-            "form_id": TEST_FORM_ID,
-            "org_id": TEST_ORG_ID,
-            "format": "xlsx",
-            "include_labels": True,
-            "include_codebook": True
-        })
-        
-        assert response.status_code in [200, 404], f"Export Excel unexpected status: {response.status_code}"
-        
-        if response.status_code == 200:
-            content_type = response.headers.get("Content-Type", "")
-            assert "spreadsheet" in content_type or "application/octet-stream" in content_type or len(response.content) > 0
-            print(f"SUCCESS: Excel export returned {len(response.content)} bytes")
-    
-    def test_export_parquet(self):
-        """Test /api/export/download exports data as Parquet"""
-        response = self.session.post(f"{BASE_URL}/api/export/download", json={
-            "form_id": TEST_FORM_ID,
-            "org_id": TEST_ORG_ID,
-            "format": "parquet"
-        })
-        
-        assert response.status_code in [200, 404], f"Export Parquet unexpected status: {response.status_code}"
-        
-        if response.status_code == 200:
-            print(f"SUCCESS: Parquet export returned {len(response.content)} bytes")
-    
-    def test_export_spss(self):
-        """Test /api/export/download exports data as SPSS"""
-        response = self.session.post(f"{BASE_URL}/api/export/download", json={
-            "form_id": TEST_FORM_ID,
-            "org_id": TEST_ORG_ID,
-            "format": "spss"
-        })
-        
-        # SPSS export may require pyreadstat library
-        assert response.status_code in [200, 404, 500], f"Export SPSS unexpected status: {response.status_code}"
-        
-        if response.status_code == 200:
-            print(f"SUCCESS: SPSS export returned {len(response.content)} bytes")
-        elif response.status_code == 500:
-            print("INFO: SPSS export may require pyreadstat library")
-    
-    def test_export_stata(self):
-        """Test /api/export/download exports data as Stata"""
-        response = self.session.post(f"{BASE_URL}/api/export/download", json={
-            "form_id": TEST_FORM_ID,
-            "org_id": TEST_ORG_ID,
-            "format": "stata"
-        })
-        
-        assert response.status_code in [200, 404, 500], f"Export Stata unexpected status: {response.status_code}"
-        
-        if response.status_code == 200:
-            print(f"SUCCESS: Stata export returned {len(response.content)} bytes")
+    def test_export_all_formats(self, test_user_request_concurrently):
+        """Test /api/export/download for every format; the exports are independent, so send them together"""
+        downloads = test_user_request_concurrently("POST", [
+            (EXPORT_URL, {"form_id": TEST_FORM_ID, "org_id": TEST_ORG_ID, "format": fmt, **fields})
+            for fmt, (fields, _, _) in EXPORT_FORMATS.items()
+        ], stream=True)
+        
+        for (fmt, (_, statuses, content_type)), (response, size) in zip(EXPORT_FORMATS.items(), downloads):
+            assert response.status_code in statuses, f"Export {fmt} unexpected status: {response.status_code}"
+            
+            if response.status_code == 200:
+                if content_type:
+                    actual = response.headers.get("Content-Type", "")
+                    assert content_type in actual or "application/octet-stream" in actual or size > 0
+                print(f"SUCCESS: {fmt} export returned {size} bytes")
+            else:
+                print(f"INFO: {fmt} export returned {response.status_code}")
     
     # ============ AI Copilot API Tests ============
     
@@ -330,7 +282,7 @@ class TestDataAnalysisModule:
             "form_id": TEST_FORM_ID,
             "org_id": TEST_ORG_ID,
             "query": "Show frequencies for all categorical variables"
-        }, timeout=30)  # AI may take time
+        })
         
         # AI may return 200 or 500 if EMERGENT_LLM_KEY not configured
         assert response.status_code in [200, 500], f"AI analyze unexpected status: {response.status_code}"
@@ -11,7 +11,6 @@ Tests for: Widget routes, Export routes, Case import routes, Collaboration route
 import pytest
 import requests
 import os
-import json
 
 # Base URL from environment
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
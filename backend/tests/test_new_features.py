@@ -6,7 +6,6 @@ Tests for iteration 4 - PWA manifest/sw, media upload API, form preview
 import pytest
 import requests
 import os
-import tempfile
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
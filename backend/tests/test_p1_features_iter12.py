@@ -5,7 +5,6 @@ Tests for: Token/Panel Surveys, CATI, Back-check, Preload/Write-back
 import pytest
 import requests
 import os
-from datetime import datetime
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
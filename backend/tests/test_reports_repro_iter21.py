@@ -5,7 +5,6 @@ Tests PDF, Word, HTML generation and Reproducibility Pack creation/download
 import pytest
 import requests
 import os
-import json
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
@@ -3,10 +3,18 @@ Survey360 - Database Optimization & Query Helpers
 Optimized queries, indexes, and connection pooling for high traffic
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import threading
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
+from pymongo import IndexModel, monitoring
+from pymongo.errors import OperationFailure
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,26 +71,485 @@ SURVEY360_INDEXES = [
 ]
 
 
+# Core DataPulse collections
+DATAPULSE_INDEXES = [
+    # Users
+    {
+        "collection": "users",
+        "indexes": [
+            {"keys": [("email", 1)], "unique": True},
+            {"keys": [("id", 1)], "unique": True},
+        ]
+    },
+    # Organizations
+    {
+        "collection": "organizations",
+        "indexes": [
+            {"keys": [("slug", 1)], "unique": True},
+            {"keys": [("id", 1)], "unique": True},
+        ]
+    },
+    # Org Members
+    {
+        "collection": "org_members",
+        "indexes": [
+            {"keys": [("org_id", 1), ("user_id", 1)], "unique": True},
+        ]
+    },
+    # Projects
+    {
+        "collection": "projects",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("status", 1)]},
+        ]
+    },
+    # Forms
+    {
+        "collection": "forms",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("project_id", 1), ("status", 1)]},
+        ]
+    },
+    # Submissions
+    {
+        "collection": "submissions",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("form_id", 1), ("submitted_at", -1)]},
+            {"keys": [("org_id", 1), ("submitted_at", -1)]},
+            {"keys": [("project_id", 1), ("status", 1)]},
+        ]
+    },
+    # Cases
+    {
+        "collection": "cases",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("project_id", 1), ("respondent_id", 1)], "unique": True},
+        ]
+    },
+    # Audit Logs
+    {
+        "collection": "audit_logs",
+        "indexes": [
+            {"keys": [("org_id", 1), ("timestamp", -1)]},
+        ]
+    },
+    # API Keys
+    {
+        "collection": "api_keys",
+        "indexes": [
+            {"keys": [("key_hash", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("is_active", 1)]},
+        ]
+    },
+    # API Audit Logs
+    {
+        "collection": "api_audit_logs",
+        "indexes": [
+            {"keys": [("org_id", 1), ("timestamp", -1)]},
+            {"keys": [("timestamp", -1)]},
+        ]
+    },
+    # Invoices
+    {
+        "collection": "invoices",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("created_at", -1)]},
+        ]
+    },
+    # Billing Events
+    {
+        "collection": "billing_events",
+        "indexes": [
+            {"keys": [("org_id", 1), ("timestamp", -1)]},
+        ]
+    },
+    # Paradata Sessions
+    {
+        "collection": "paradata_sessions",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("submission_id", 1)]},
+            {"keys": [("enumerator_id", 1), ("session_start", -1)]},
+            {"keys": [("form_id", 1), ("session_start", -1)]},
+        ]
+    },
+    # Submission Revisions
+    {
+        "collection": "submission_revisions",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("submission_id", 1), ("version", 1)]},
+        ]
+    },
+    # Revision Audit Trail
+    {
+        "collection": "revision_audit_trail",
+        "indexes": [
+            {"keys": [("submission_id", 1), ("timestamp", 1)]},
+        ]
+    },
+    # Correction Requests
+    {
+        "collection": "correction_requests",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("enumerator_id", 1), ("status", 1)]},
+        ]
+    },
+    # Lookup Datasets
+    {
+        "collection": "lookup_datasets",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("is_active", 1)]},
+        ]
+    },
+    # Dataset Write-back Log
+    {
+        "collection": "dataset_write_back_log",
+        "indexes": [
+            {"keys": [("dataset_id", 1), ("timestamp", -1)]},
+        ]
+    },
+    # Survey Distributions (Token/Panel Surveys)
+    {
+        "collection": "survey_distributions",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("status", 1)]},
+        ]
+    },
+    {
+        "collection": "survey_invites",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("token_hash", 1)], "unique": True},
+            {"keys": [("distribution_id", 1), ("status", 1)]},
+        ]
+    },
+    {
+        "collection": "survey_panels",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+        ]
+    },
+    {
+        "collection": "panel_members",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("panel_id", 1), ("status", 1)]},
+        ]
+    },
+    # CATI (Computer-Assisted Telephone Interviewing)
+    {
+        "collection": "cati_projects",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("status", 1)]},
+        ]
+    },
+    {
+        "collection": "cati_queue",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("project_id", 1), ("status", 1), ("priority", -1)]},
+            {"keys": [("locked_by", 1), ("status", 1)]},
+        ]
+    },
+    {
+        "collection": "cati_calls",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("project_id", 1), ("start_time", -1)]},
+            {"keys": [("interviewer_id", 1), ("start_time", -1)]},
+        ]
+    },
+    # Back-check Module
+    {
+        "collection": "backcheck_configs",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("project_id", 1)]},
+        ]
+    },
+    {
+        "collection": "backchecks",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("config_id", 1), ("status", 1)]},
+            {"keys": [("assigned_to", 1), ("status", 1)]},
+            {"keys": [("original_enumerator_id", 1)]},
+        ]
+    },
+    {
+        "collection": "enumerator_quality",
+        "indexes": [
+            {"keys": [("enumerator_id", 1)], "unique": True},
+        ]
+    },
+    # Preload/Write-back
+    {
+        "collection": "preload_configs",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("form_id", 1)]},
+        ]
+    },
+    {
+        "collection": "writeback_configs",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("form_id", 1)]},
+        ]
+    },
+    {
+        "collection": "preload_logs",
+        "indexes": [
+            {"keys": [("form_id", 1), ("timestamp", -1)]},
+        ]
+    },
+    {
+        "collection": "writeback_logs",
+        "indexes": [
+            {"keys": [("form_id", 1), ("timestamp", -1)]},
+        ]
+    },
+    {
+        "collection": "external_api_configs",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+        ]
+    },
+    # Quality AI Monitoring
+    {
+        "collection": "speeding_configs",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("form_id", 1)]},
+        ]
+    },
+    {
+        "collection": "audio_audit_configs",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("form_id", 1)]},
+        ]
+    },
+    {
+        "collection": "ai_monitoring_configs",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1)]},
+        ]
+    },
+    {
+        "collection": "quality_alerts",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("status", 1)]},
+            {"keys": [("submission_id", 1), ("alert_type", 1)]},
+        ]
+    },
+    {
+        "collection": "ai_analyses",
+        "indexes": [
+            {"keys": [("submission_id", 1)]},
+        ]
+    },
+    # CAWI Sessions
+    {
+        "collection": "cawi_sessions",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("form_id", 1), ("token", 1)]},
+            {"keys": [("form_id", 1), ("status", 1)]},
+        ]
+    },
+    # AI Field Simulation
+    {
+        "collection": "simulation_reports",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("form_id", 1)]},
+            {"keys": [("created_at", -1)]},
+        ]
+    },
+    # Device Management & Remote Wipe
+    {
+        "collection": "devices",
+        "indexes": [
+            {"keys": [("id", 1)], "unique": True},
+            {"keys": [("org_id", 1), ("user_id", 1)]},
+            {"keys": [("org_id", 1), ("status", 1)]},
+        ]
+    },
+    {
+        "collection": "device_activity_logs",
+        "indexes": [
+            {"keys": [("device_id", 1), ("timestamp", -1)]},
+            {"keys": [("org_id", 1), ("timestamp", -1)]},
+        ]
+    },
+]
+
+INDEX_SPECS = SURVEY360_INDEXES + DATAPULSE_INDEXES
+
+INDEX_META_COLLECTION = "_meta"
+INDEX_META_ID = "index_specs"
+
+
+# Index options that change an index's behaviour; an existing index only
+# satisfies a spec when these match as well as the keys
+SIGNATURE_OPTIONS = ("expireAfterSeconds", "partialFilterExpression")
+
+
+def _index_signature(keys, options: Dict[str, Any]) -> tuple:
+    """Normalize an index spec or listIndexes entry for comparison"""
+    if isinstance(keys, str):
+        key_signature = ((keys, 1),)
+    else:
+        key_signature = tuple((field, direction) for field, direction in keys)
+    return (
+        key_signature,
+        bool(options.get("unique", False)),
+        *(json.dumps(options.get(option), sort_keys=True, default=str) for option in SIGNATURE_OPTIONS),
+    )
+
+
+def index_specs_hash(specs: List[Dict[str, Any]] = INDEX_SPECS) -> str:
+    """Stable hash of the declared index specs"""
+    return hashlib.sha1(json.dumps(specs, sort_keys=True).encode()).hexdigest()
+
+
+def _index_model(index_config: Dict[str, Any]) -> IndexModel:
+    options = {"unique": index_config.get("unique", False), "background": True}
+    if index_config.get("name"):
+        options["name"] = index_config["name"]
+    for option in SIGNATURE_OPTIONS:
+        if option in index_config:
+            options[option] = index_config[option]
+    return IndexModel(index_config["keys"], **options)
+
+
+async def _create_index_batch(collection, models: List[IndexModel]) -> int:
+    """
+    Create a collection's indexes with one createIndexes command.
+    
+    A single conflicting index fails the whole command, so on failure the
+    models are retried one by one and only the conflicts are skipped.
+    Returns how many of the models were created or already present.
+    """
+    try:
+        await collection.create_indexes(models)
+        return len(models)
+    except OperationFailure as e:
+        logger.debug(f"Batch index creation on {collection.name} failed, retrying individually: {e}")
+    
+    created = 0
+    for model in models:
+        try:
+            await collection.create_indexes([model])
+            created += 1
+        except OperationFailure as err:
+            logger.debug(f"Index on {collection.name} already exists: {err}")
+    return created
+
+
+async def _existing_index_keys(collection) -> set:
+    indexes = await collection.list_indexes().to_list(None)
+    return {_index_signature(idx["key"].items(), idx) for idx in indexes}
+
+
+async def ensure_indexes(db, specs: List[Dict[str, Any]] = INDEX_SPECS) -> Dict[str, int]:
+    """
+    Create only the declared indexes that are missing.
+    
+    The spec hash is stored in the _meta collection once every index is in
+    place, so warm restarts with unchanged specs cost a single find_one.
+    """
+    meta = db[INDEX_META_COLLECTION]
+    spec_hash = index_specs_hash(specs)
+    
+    stored = await meta.find_one({"_id": INDEX_META_ID})
+    if stored and stored.get("hash") == spec_hash:
+        return {}
+    
+    collections = list(dict.fromkeys(config["collection"] for config in specs))
+    existing = dict(zip(
+        collections,
+        await asyncio.gather(*[_existing_index_keys(db[name]) for name in collections])
+    ))
+    
+    models_by_collection: Dict[str, List[IndexModel]] = {}
+    missing: Dict[str, List[tuple]] = {}
+    for config in specs:
+        name = config["collection"]
+        for idx in config["indexes"]:
+            signature = _index_signature(idx["keys"], idx)
+            if signature in existing[name]:
+                continue
+            models_by_collection.setdefault(name, []).append(_index_model(idx))
+            missing.setdefault(name, []).append(signature)
+    
+    tasks = [
+        _create_index_batch(db[name], models)
+        for name, models in models_by_collection.items()
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    created = {}
+    for name, result in zip(models_by_collection, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error creating indexes on {name}: {result}")
+            created[name] = 0
+        else:
+            created[name] = result
+    
+    # The spec hash acts as the commit record for the whole index set, so it
+    # is only written once every declared index is confirmed to exist.
+    # Conflicts skipped above keep the hash unset and are retried (and
+    # reported) on the next start instead of being silently forgotten.
+    touched = list(missing)
+    present = dict(zip(
+        touched,
+        await asyncio.gather(*[_existing_index_keys(db[name]) for name in touched])
+    ))
+    still_missing = {
+        name: [sig for sig in signatures if sig not in present[name]]
+        for name, signatures in missing.items()
+    }
+    still_missing = {name: sigs for name, sigs in still_missing.items() if sigs}
+    
+    if still_missing:
+        logger.warning(f"Indexes still missing after creation: {still_missing}")
+    else:
+        await meta.update_one(
+            {"_id": INDEX_META_ID},
+            {"$set": {"hash": spec_hash, "updated_at": datetime.now(timezone.utc).isoformat()}},
+            upsert=True
+        )
+    
+    return created
+
+
 async def create_indexes(db) -> Dict[str, int]:
     """Create all required indexes for Survey360 collections"""
     results = {}
     
     for collection_config in SURVEY360_INDEXES:
         collection_name = collection_config["collection"]
-        collection = db[collection_name]
+        models = [_index_model(index_config) for index_config in collection_config["indexes"]]
         created = 0
         
-        for index_config in collection_config["indexes"]:
-            try:
-                await collection.create_index(
-                    index_config["keys"],
-                    name=index_config.get("name"),
-                    unique=index_config.get("unique", False),
-                    background=True
-                )
-                created += 1
-            except Exception as e:
-                logger.warning(f"Index creation warning for {collection_name}: {e}")
+        try:
+            created = await _create_index_batch(db[collection_name], models)
+        except Exception as e:
+            logger.warning(f"Index creation warning for {collection_name}: {e}")
         
         results[collection_name] = created
         logger.info(f"Created {created} indexes for {collection_name}")
@@ -307,24 +774,99 @@ class OptimizedQueries:
 # CONNECTION POOL MONITOR
 # ============================================
 
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """
+    Keeps running connection pool counters from PyMongo pool events.
+    
+    Events fire on driver threads, so counters are guarded by a thread lock.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {
+            "current": 0,
+            "active": 0,
+            "total_created": 0,
+            "checkout_failures": 0
+        }
+    
+    def _add(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] += amount
+    
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._counters)
+        stats["available"] = max(stats["current"] - stats["active"], 0)
+        return stats
+    
+    def connection_created(self, event):
+        with self._lock:
+            self._counters["current"] += 1
+            self._counters["total_created"] += 1
+    
+    def connection_closed(self, event):
+        self._add("current", -1)
+    
+    def connection_checked_out(self, event):
+        self._add("active")
+    
+    def connection_checked_in(self, event):
+        self._add("active", -1)
+    
+    def connection_check_out_failed(self, event):
+        self._add("checkout_failures")
+    
+    def pool_created(self, event):
+        pass
+    
+    def pool_ready(self, event):
+        pass
+    
+    def pool_cleared(self, event):
+        pass
+    
+    def pool_closed(self, event):
+        pass
+    
+    def connection_ready(self, event):
+        pass
+    
+    def connection_check_out_started(self, event):
+        pass
+
+
 class ConnectionPoolMonitor:
     """Monitor MongoDB connection pool health"""
     
-    def __init__(self, client):
+    STATS_TTL = 0.5  # Seconds to reuse a serverStatus result
+    
+    def __init__(self, client, listener: Optional[PoolStatsListener] = None):
         self.client = client
+        self.listener = listener
+        self._stats = None
+        self._stats_at = 0.0
     
     async def get_pool_stats(self) -> Dict[str, Any]:
         """Get connection pool statistics"""
+        if self.listener:
+            return self.listener.snapshot()
+        
+        if self._stats is not None and time.monotonic() - self._stats_at < self.STATS_TTL:
+            return self._stats
+        
         try:
             server_status = await self.client.admin.command("serverStatus")
             connections = server_status.get("connections", {})
             
-            return {
+            self._stats = {
                 "current": connections.get("current", 0),
                 "available": connections.get("available", 0),
                 "total_created": connections.get("totalCreated", 0),
                 "active": connections.get("active", 0)
             }
+            self._stats_at = time.monotonic()
+            return self._stats
         except Exception as e:
             logger.error(f"Failed to get pool stats: {e}")
             return {}
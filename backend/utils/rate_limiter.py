@@ -4,6 +4,8 @@ DataPulse - Rate Limiting
 API rate limiting to prevent abuse and ensure fair resource usage.
 """
 
+import hashlib
+
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -13,7 +15,9 @@ from fastapi.responses import JSONResponse
 from config.scalability import (
     RATE_LIMIT_STATS,
     RATE_LIMIT_EXPORT,
-    RATE_LIMIT_GENERAL
+    RATE_LIMIT_GENERAL,
+    RATE_LIMIT_STORAGE_URI,
+    RATE_LIMIT_STRATEGY
 )
 
 
@@ -29,16 +33,22 @@ def get_user_identifier(request: Request) -> str:
     # Try to get from authorization header
     auth_header = request.headers.get("Authorization", "")
     if auth_header.startswith("Bearer "):
-        # Use a hash of the token as identifier
-        token_hash = hash(auth_header[7:])
+        # Use a hash of the token as identifier (stable across workers)
+        token_hash = hashlib.sha256(auth_header[7:].encode()).hexdigest()[:16]
         return f"token:{token_hash}"
     
     # Fall back to IP address
     return f"ip:{get_remote_address(request)}"
 
 
-# Create limiter instance
-limiter = Limiter(key_func=get_user_identifier)
+# Create limiter instance backed by shared storage, falling back to
+# in-process counters if the storage is unreachable
+limiter = Limiter(
+    key_func=get_user_identifier,
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy=RATE_LIMIT_STRATEGY,
+    in_memory_fallback_enabled=True
+)
 
 
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
@@ -5,7 +5,7 @@ Caches public survey responses and API responses for high traffic
 
 import hashlib
 import json
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -19,7 +19,12 @@ logger = logging.getLogger(__name__)
 class ResponseCacheMiddleware(BaseHTTPMiddleware):
     """
     Middleware to cache API responses for GET requests.
-    Caches based on URL path and query parameters.
+    Caches based on URL path, query parameters and caller identity.
+    
+    An explicit prefix allow-list can be given at install time, replacing
+    the built-in route tables:
+        app.add_middleware(ResponseCacheMiddleware,
+                           cached_endpoints=["/api/dashboard/"], default_ttl=30)
     """
     
     # Routes to cache and their TTLs
@@ -41,6 +46,16 @@ class ResponseCacheMiddleware(BaseHTTPMiddleware):
         "/api/health",
     ]
     
+    def __init__(self, app, cached_endpoints: Optional[Iterable[str]] = None, default_ttl: int = CacheConfig.DEFAULT_TTL):
+        super().__init__(app)
+        if cached_endpoints is not None:
+            self.CACHEABLE_ROUTES = {}
+            self.CACHEABLE_PATTERNS = []
+        # A tuple lets str.startswith test every prefix in one call
+        self.cached_prefixes = tuple(cached_endpoints or ())
+        self.skip_prefixes = tuple(self.SKIP_CACHE_ROUTES)
+        self.default_ttl = default_ttl
+    
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Only cache GET requests
         if request.method != "GET":
@@ -49,9 +64,8 @@ class ResponseCacheMiddleware(BaseHTTPMiddleware):
         path = request.url.path
         
         # Skip certain routes
-        for skip_route in self.SKIP_CACHE_ROUTES:
-            if path.startswith(skip_route):
-                return await call_next(request)
+        if path.startswith(self.skip_prefixes):
+            return await call_next(request)
         
         # Determine TTL for this route
         ttl = self._get_route_ttl(path)
@@ -61,8 +75,9 @@ class ResponseCacheMiddleware(BaseHTTPMiddleware):
         # Generate cache key
         cache_key = self._generate_cache_key(request)
         
-        # Try to get from cache
-        cached_response = await cache.get(cache_key)
+        # Try to get from cache unless the client asked for a fresh response
+        no_cache = "no-cache" in request.headers.get("Cache-Control", "")
+        cached_response = None if no_cache else await cache.get(cache_key)
         if cached_response:
             logger.debug(f"Cache HIT: {path}")
             return JSONResponse(
@@ -118,6 +133,9 @@ class ResponseCacheMiddleware(BaseHTTPMiddleware):
             if path.startswith(pattern):
                 return ttl
         
+        if self.cached_prefixes and path.startswith(self.cached_prefixes):
+            return self.default_ttl
+        
         return None
     
     def _generate_cache_key(self, request: Request) -> str:
@@ -127,8 +145,10 @@ class ResponseCacheMiddleware(BaseHTTPMiddleware):
         
         # Include user context if available (for personalized responses)
         user_id = request.headers.get("X-User-ID", "anonymous")
+        auth = request.headers.get("Authorization", "")
+        auth_hash = hashlib.md5(auth.encode()).hexdigest()[:12] if auth else "anonymous"
         
-        key_data = f"{path}:{query}:{user_id}"
+        key_data = f"{request.method}:{path}:{query}:{user_id}:{auth_hash}"
         key_hash = hashlib.md5(key_data.encode()).hexdigest()[:12]
         
         return f"response_cache:{key_hash}"